@@ -0,0 +1,28 @@
+# Generated by Django 5.0.4 on 2026-10-15 22:34
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0001_alter_appointment_created_at_alter_appointment_notes_and_more'),
+        ('services', '0002_alter_service_created_at_alter_service_description_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(fields=['starts_at', 'ends_at'], name='appt_starts_ends_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(fields=['user', 'starts_at'], name='appt_user_starts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(fields=['status', 'starts_at'], name='appt_status_starts_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.0.4 on 2026-10-15 22:35
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0002_add_appointment_indexes'),
+        ('services', '0002_alter_service_created_at_alter_service_description_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='appointment',
+            constraint=models.CheckConstraint(check=models.Q(('confirmation_number__isnull', True), models.Q(('confirmation_number__gte', 100000000), ('confirmation_number__lte', 999999999)), _connector='OR'), name='appt_confirmation_number_9_digits'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.0.4 on 2026-10-15 23:29
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0003_add_confirmation_number_check'),
+        ('services', '0002_alter_service_created_at_alter_service_description_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='appointment',
+            name='confirmation_number',
+            field=models.IntegerField(null=True),
+        ),
+        migrations.AddConstraint(
+            model_name='appointment',
+            constraint=models.UniqueConstraint(fields=('confirmation_number',), name='appt_confirmation_number_unique'),
+        ),
+    ]
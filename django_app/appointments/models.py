@@ -14,10 +14,10 @@ class Appointment(models.Model):
         id (UUIDField): A unique identifier for each appointment.
         created_at (DateTimeField): The timestamp when the appointment was created.
         updated_at (DateTimeField): The timestamp when the appointment was last updated.
-        starts_at (DateTimeField): The date and time when the appointment is scheduled to take begin.
-        ends_at (DateTimeField): The date and time when the appointment is scheduled to take end.
+        starts_at (DateTimeField): The date and time when the appointment is scheduled to begin.
+        ends_at (DateTimeField): The date and time when the appointment is scheduled to end.
         status (CharField): The current status of the appointment, e.g., 'scheduled', 'completed', 'canceled'.
-        confirmation_number: A unique confirmation code sent to customers, e.g, for tracking appointments, verifying bookings etc.
+        confirmation_number (IntegerField): A unique confirmation code sent to customers, e.g, for tracking appointments, verifying bookings etc.
         notes (CharField): Optional notes or special instructions related to the appointment.
         user (ForeignKey): A reference to the user who booked the appointment. Linked to the CustomUser model.
         service (ForeignKey): A reference to the service that has been booked for the appointment. Linked to the Service model.
@@ -27,6 +27,15 @@ class Appointment(models.Model):
         - many-to-one with Service
         - one-to-many with Notification (Relationship defined in Notification data model)
 
+    ## Indexes
+    - (starts_at, ends_at): time-range and overlap lookups.
+    - (user, starts_at): a user's upcoming appointments.
+    - (status, starts_at): appointments with a given status, in time order.
+
+    ## Constraints
+    - confirmation_number, when set, must be 9 digits long.
+    - confirmation_number, when set, must be unique. Declared as a named constraint, so a violation can be told apart by name.
+
     ## Validation
     Only database level validation should be defined in this class.
     """
@@ -37,7 +46,7 @@ class Appointment(models.Model):
     starts_at = models.DateTimeField(null=False)
     ends_at = models.DateTimeField(null=False)
     status = models.CharField(null=False)
-    confirmation_number = models.IntegerField(unique=True, null=True)
+    confirmation_number = models.IntegerField(null=True)
     notes = models.CharField(null=True)
 
     # Relationships with foreign entities
@@ -54,4 +63,19 @@ class Appointment(models.Model):
         null=False
     )
 
-
+    class Meta:
+        indexes = [
+            models.Index(fields=['starts_at', 'ends_at'], name='appt_starts_ends_idx'),
+            models.Index(fields=['user', 'starts_at'], name='appt_user_starts_idx'),
+            models.Index(fields=['status', 'starts_at'], name='appt_status_starts_idx'),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                check=(
+                    models.Q(confirmation_number__isnull=True)
+                    | models.Q(confirmation_number__gte=100_000_000, confirmation_number__lte=999_999_999)
+                ),
+                name='appt_confirmation_number_9_digits',
+            ),
+            models.UniqueConstraint(fields=['confirmation_number'], name='appt_confirmation_number_unique'),
+        ]
@@ -1,47 +1,57 @@
-from django.db import IntegrityError
+from django.db import transaction
 from appointments.models import Appointment
 from appointments.repositories.interfaces.appointment_repository_interface import AppointmentRepositoryInterface
+from common.ids import is_valid_uuid
 
 
 class AppointmentRepository(AppointmentRepositoryInterface):
     def get_appointment_by_id(self, appointment_id):
-        try:
-            return Appointment.objects.get(id=appointment_id)
-        except:
+        if not is_valid_uuid(appointment_id):
             return None
+        return Appointment.objects.filter(pk=appointment_id).first()
         
+    def get_appointment_for_update(self, appointment_id):
+        if not is_valid_uuid(appointment_id):
+            return None
+        return Appointment.objects.select_for_update().filter(pk=appointment_id).first()
+
     def get_all_appointments(self):
-        return Appointment.objects.all()
+        return Appointment.objects.select_related('user', 'service')
+
+    def iter_all_appointments(self):
+        return Appointment.objects.select_related('user', 'service').iterator(chunk_size=2000)
     
     def create_appointment(self, appointment_data):
-        try:
+        # Confirmation number uniqueness is left to the database, so the IntegrityError is left for the service to report.
+        # The savepoint keeps a surrounding transaction usable when it is raised.
+        with transaction.atomic():
             return Appointment.objects.create(**appointment_data)
-        except IntegrityError:
-            return None
+
+    def bulk_create_appointments(self, appointments_data):
+        # As with create_appointment, the IntegrityError is left for the caller to report. The savepoint ensures none of
+        # the batch is kept when it is raised.
+        with transaction.atomic():
+            return Appointment.objects.bulk_create(
+                [Appointment(**appointment_data) for appointment_data in appointments_data],
+                batch_size=500,
+            )
         
     def update_appointment(self, appointment_id, appointment_data):
-        try:
-            appointment = Appointment.objects.get(id=appointment_id)
-            for key, value in appointment_data.items():
-                setattr(appointment, key, value)
-            appointment.save()
-            return appointment
-        except Appointment.DoesNotExist:
+        if not is_valid_uuid(appointment_id):
             return None
-        except IntegrityError:
+        # Run in a savepoint, so that a conflicting update, whose IntegrityError is left for the service to report, does not
+        # break the transaction AppointmentService.update_appointment holds the row lock in.
+        with transaction.atomic():
+            updated = Appointment.objects.filter(pk=appointment_id).update(**appointment_data)
+        if not updated:
             return None
+        return Appointment.objects.select_related('user', 'service').get(pk=appointment_id)
         
     def delete_appointment(self, appointment_id):
-        try:
-            appointment = Appointment.objects.get(id=appointment_id)
-            appointment.delete()
-            return True
-        except Appointment.DoesNotExist:
+        if not is_valid_uuid(appointment_id):
             return False
+        deleted_count, _ = Appointment.objects.filter(pk=appointment_id).delete()
+        return deleted_count > 0
 
-    def get_appointment_by_confirmation_number(self, confirmation_number):
-        try:
-            return Appointment.objects.filter(confirmation_number=confirmation_number)
-        except:
-            return None
-            
+
+appointment_repository = AppointmentRepository()
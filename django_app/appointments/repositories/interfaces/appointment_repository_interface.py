@@ -6,14 +6,26 @@ class AppointmentRepositoryInterface(ABC):
     def get_appointment_by_id(self, appointment_id):
         pass
 
+    @abstractmethod
+    def get_appointment_for_update(self, appointment_id):
+        pass
+
     @abstractmethod
     def get_all_appointments(self):
         pass
 
+    @abstractmethod
+    def iter_all_appointments(self):
+        pass
+
     @abstractmethod
     def create_appointment(self, appointment_data):
         pass
 
+    @abstractmethod
+    def bulk_create_appointments(self, appointments_data):
+        pass
+
     @abstractmethod
     def update_appointment(self, appointment_id, appointment_data):
         pass
@@ -1,12 +1,30 @@
-from datetime import datetime
-
 from django.core.exceptions import ValidationError
-from django.utils.timezone import make_aware as make_aware_of_timezone
+from django.db import IntegrityError, transaction
+from django.utils import timezone
 
-from appointments.repositories.appointment_repository import AppointmentRepository
+from appointments.repositories.appointment_repository import appointment_repository
 from appointments.services.interfaces.appointment_service_interface import AppointmentServiceInterface
 from appointments.services.validators.appointment_service_validator import AppointmentServiceValidator
 
+# Messages for the appointment constraints only the database checks, keyed by constraint name (see Appointment.Meta).
+_CONSTRAINT_VIOLATION_MESSAGES = {
+    'appt_confirmation_number_unique': "Appointment with confirmation number %(confirmation_number)s already exists.",
+    'appt_confirmation_number_9_digits': "Appointment confirmation number %(confirmation_number)s must be 9 digits long.",
+}
+
+
+def _constraint_violation_error(error, appointment_data, default_message):
+    """
+    Returns a ValidationError for the IntegrityError `error`, naming the violated constraint when it is a known one.
+
+    The constraint is read from the database driver's error, which Django sets as the cause, rather than from the
+    message text, which varies with the database and its locale.
+    """
+    constraint_name = getattr(getattr(error.__cause__, 'diag', None), 'constraint_name', None)
+    message = _CONSTRAINT_VIOLATION_MESSAGES.get(constraint_name)
+    if message is None:
+        return ValidationError(default_message, params={'error': error})
+    return ValidationError(message, params={'confirmation_number': appointment_data.get('confirmation_number')})
 
 
 class AppointmentService(AppointmentServiceInterface):
@@ -21,7 +39,7 @@ class AppointmentService(AppointmentServiceInterface):
         delete_appointment(appointment_id)
     """
     def __init__(self):
-        self.appointment_repository = AppointmentRepository()
+        self.appointment_repository = appointment_repository
         self.validator = AppointmentServiceValidator()
 
     def get_appointment(self, appointment_id):
@@ -34,29 +52,38 @@ class AppointmentService(AppointmentServiceInterface):
         return appointments
 
     def create_appointment(self, appointment_data):
-        appointment_data['created_at'] = make_aware_of_timezone(datetime.now())
-        appointment_data['updated_at'] = make_aware_of_timezone(datetime.now())
+        now = timezone.now()
+        appointment_data['created_at'] = now
+        appointment_data['updated_at'] = now
         self.validator.validate_appointment_data(appointment_data)
         try:
-            self.appointment_repository.create_appointment(appointment_data)
+            return self.appointment_repository.create_appointment(appointment_data)
+        except IntegrityError as e:
+            raise _constraint_violation_error(e, appointment_data, "Error creating appointment: %(error)s")
         except Exception as e:
-            raise ValidationError(f"Error creating appointment: {e}")
+            raise ValidationError("Error creating appointment: %(error)s", params={'error': e})
 
     def update_appointment(self, appointment_id, appointment_data):
-        appointment = self.appointment_repository.get_appointment_by_id(appointment_id)
-        self.validator.validate_appointment_exists(appointment, appointment_id)
-        # Set updated_at timestamp and validate data before updating.
-        appointment_data['updated_at'] = make_aware_of_timezone(datetime.now())
-        self.validator.validate_appointment_data(appointment_data, is_update=True)
-        try:
-            return self.appointment_repository.update_appointment(appointment_id, appointment_data)
-        except Exception as e:
-            raise ValidationError(f"Error updating appointment: {e}")
+        # The existence check and the update share one transaction, with the row locked until it commits,
+        # so a concurrent writer cannot change or delete the appointment in between.
+        with transaction.atomic():
+            appointment = self.appointment_repository.get_appointment_for_update(appointment_id)
+            self.validator.validate_appointment_exists(appointment, appointment_id)
+            # Set updated_at timestamp and validate data before updating.
+            appointment_data['updated_at'] = timezone.now()
+            self.validator.validate_appointment_data(appointment_data, is_update=True)
+            try:
+                return self.appointment_repository.update_appointment(appointment_id, appointment_data)
+            except IntegrityError as e:
+                raise _constraint_violation_error(e, appointment_data, "Error updating appointment: %(error)s")
+            except Exception as e:
+                raise ValidationError("Error updating appointment: %(error)s", params={'error': e})
 
     def delete_appointment(self, appointment_id):
-        appointment = self.appointment_repository.get_appointment_by_id(appointment_id)
-        self.validator.validate_appointment_exists(appointment, appointment_id)
         try:
             return self.appointment_repository.delete_appointment(appointment_id)
         except Exception as e:
-            raise ValidationError(f"Error deleting appointment: {e}")
\ No newline at end of file
+            raise ValidationError("Error deleting appointment: %(error)s", params={'error': e})
+
+
+appointment_service = AppointmentService()
@@ -2,8 +2,7 @@ import re
 
 from datetime import datetime
 from django.core.exceptions import ValidationError
-
-from appointments.repositories.appointment_repository import AppointmentRepository
+from django.utils.timezone import is_aware
 
 class AppointmentServiceValidator:
     """
@@ -15,14 +14,13 @@ class AppointmentServiceValidator:
         validate_updated_at(updated_at)
         
     """
-    ALLOWED_APPOINTMENT_STATUSES = ["scheduled", "completed", "canceled"]
-
-    def __init__(self):
-        self.appointment_repository = AppointmentRepository()
+    ALLOWED_APPOINTMENT_STATUSES = frozenset({"scheduled", "completed", "canceled"})
 
     def validate_appointment_exists(self, appointment, appointment_id):
         if not appointment:
-            raise ValidationError(f"Appointment with ID {appointment_id} does not exist.")
+            raise ValidationError(
+                "Appointment with ID %(appointment_id)s does not exist.", params={'appointment_id': appointment_id}
+            )
 
     def validate_appointment_data(self, appointment_data, is_update=False):
         """
@@ -43,10 +41,7 @@ class AppointmentServiceValidator:
             ends_at=appointment_data.get('ends_at', None)
         )
         self.validate_status(status=appointment_data.get('status', None))
-        self.validate_confirmation_number(
-            confirmation_number=appointment_data.get('confirmation_number', None),
-            appointment_id=appointment_data.get('id', None)
-        )
+        self.validate_confirmation_number(confirmation_number=appointment_data.get('confirmation_number', None))
 
     def validate_created_at(self, created_at):
         # TODO: move created/updated validation to a 'common' module used in all apps
@@ -61,7 +56,7 @@ class AppointmentServiceValidator:
             raise ValidationError("created_at is required.")
         if not isinstance(created_at, datetime):
             raise ValidationError("created_at must be a datetime object.")
-        if created_at.tzinfo is None or created_at.tzinfo.utcoffset(created_at) is None:
+        if not is_aware(created_at):
             raise ValidationError("created_at must be an aware datetime object with timezone information.")
 
     def validate_updated_at(self, updated_at):
@@ -76,7 +71,7 @@ class AppointmentServiceValidator:
             raise ValidationError("updated_at is required.")
         if not isinstance(updated_at, datetime):
             raise ValidationError("updated_at must be a datetime object.")
-        if updated_at.tzinfo is None or updated_at.tzinfo.utcoffset(updated_at) is None:
+        if not is_aware(updated_at):
             raise ValidationError("updated_at must be an aware datetime object with timezone information.")
         
     def validate_starts_at_ends_at(self, starts_at, ends_at):
@@ -85,9 +80,7 @@ class AppointmentServiceValidator:
             raise ValidationError("Both starts_at and ends_at are required.")
         if not isinstance(starts_at, datetime) or not isinstance(ends_at, datetime):
             raise ValidationError("Both starts_at and ends_at must be datetime objects")
-        is_starts_at_unaware = starts_at.tzinfo is None or starts_at.tzinfo.utcoffset(starts_at) is None
-        is_ends_at_unaware = ends_at.tzinfo is None or ends_at.tzinfo.utcoffset(ends_at) is None
-        if is_starts_at_unaware or is_ends_at_unaware:
+        if not is_aware(starts_at) or not is_aware(ends_at):
             raise ValidationError("Both starts_at and ends_at must be aware datetime objects with timezone information.")
         if starts_at > ends_at:
             raise ValidationError("End time cannot be earlier than end time")
@@ -102,25 +95,19 @@ class AppointmentServiceValidator:
         if not status:
             raise ValidationError("status is required.")
         if status not in self.ALLOWED_APPOINTMENT_STATUSES:
-            allowed_statuses_str = ", ".join(self.ALLOWED_APPOINTMENT_STATUSES)
-            raise ValidationError(f"status must be one of the following: {allowed_statuses_str}")
+            raise ValidationError(
+                "status must be one of the following: %(allowed_statuses)s",
+                params={'allowed_statuses': ", ".join(sorted(self.ALLOWED_APPOINTMENT_STATUSES))}
+            )
 
-    def validate_confirmation_number(self, confirmation_number, appointment_id):
+    def validate_confirmation_number(self, confirmation_number):
         """
-        Validate the confirmation number for the appointment
+        Validate the confirmation number for the appointment.
+
+        Uniqueness is not checked here; it is enforced by the unique constraint on the model.
         """
         if confirmation_number:
-            # Validate confirmation_number is unique
-            appointment_queryset = self.appointment_repository.get_appointment_by_confirmation_number(confirmation_number)
-            appointment_list = list(appointment_queryset.values_list('id', flat=True))
-            appointment_str = ", ".join([str(appointment) for appointment in appointment_list])
-            if len(appointment_list) > 1:
-                # This could occur if someone bypassed the service layer and manually updated the DB, this would be an edge case.
-                raise ValidationError(f"Multiple appointments ({str(appointment_str)}) with same confirmation number. Confirmation number must be unique")
-            appointment = appointment_list[0]
-            if appointment and appointment.id != appointment_id:
-                # This is more likely to be triggered than the above, this is if the system tries to create a new confirmation number which already exists.
-                raise ValidationError(f"Appointment with confirmation number already exists ({appointment_str}). Confirmation number must be unique")
-            # Validate confirmation_number is 9 digits
-            if len(confirmation_number) != 9:
+            if not isinstance(confirmation_number, int):
+                raise ValidationError("confirmation number must be an integer")
+            if not (100_000_000 <= confirmation_number <= 999_999_999):
                 raise ValidationError("confirmation number must be 9 digits long")
@@ -14,12 +14,15 @@ from users.models import CustomUser
 class TestAppointment:
     """This tests the Appointment entity at the database level"""
 
+    # A fixed timestamp keeps the field values deterministic and is localized once for the whole class.
+    _FIXED_NOW = make_aware_of_timezone(datetime(2024, 1, 1, 12, 0, 0))
+
     # Field values
     appointment_id = uuid.uuid4()
-    created_at = make_aware_of_timezone(datetime.now())
-    updated_at = make_aware_of_timezone(datetime.now())
-    starts_at = make_aware_of_timezone(datetime.now() + timedelta(days=1))
-    ends_at = make_aware_of_timezone(datetime.now() + timedelta(days=1, hours=1))
+    created_at = _FIXED_NOW
+    updated_at = _FIXED_NOW
+    starts_at = _FIXED_NOW + timedelta(days=1)
+    ends_at = _FIXED_NOW + timedelta(days=1, hours=1)
     status = 'test_status'
     confirmation_number = 123456789
 
@@ -202,3 +205,34 @@ class TestAppointment:
         assert "duplicate key value violates unique constraint" in str(unique_contraint_violation_error)
         assert (f"Key ({error_text})=({getattr(appointment, error_text)}) already exists"
                 in str(unique_contraint_violation_error))
+
+    @pytest.mark.parametrize(
+            'confirmation_number',
+            [
+                12345678,
+                1234567890,
+            ]
+    )
+    def test_check_constraint_violated(self, confirmation_number):
+        """
+        Each iteration attempts creation with a value which violates a 'check' constraint.
+
+        ALL 'check' constraints defined on the model should be tested here.
+        """
+        user, service = self.create_appointment_entity_dependencies()
+
+        with pytest.raises(IntegrityError) as check_constraint_violation_error:
+            Appointment.objects.create(
+                # Tested fields
+                confirmation_number=confirmation_number,
+                # Non-tested fields needed for object creation
+                created_at=self.created_at,
+                updated_at=self.updated_at,
+                starts_at=self.starts_at,
+                ends_at=self.ends_at,
+                status=self.status,
+                user=user,
+                service=service,
+            )
+
+        assert 'violates check constraint "appt_confirmation_number_9_digits"' in str(check_constraint_violation_error.value)
@@ -1,10 +1,26 @@
 import pytest
+import uuid
 
 from django.db import IntegrityError
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock
 
-from appointments.models import Appointment
-from appointments.repositories.appointment_repository import AppointmentRepository
+
+class FakeAppointment:
+    """
+    A lightweight stand-in for an Appointment instance.
+
+    The repository tests only pass appointments through the mocked ORM, so this avoids the cost of
+    MagicMock(spec=Appointment) introspecting the model for every test.
+    """
+    def __init__(self):
+        self.id = None
+        self.status = None
+        self.confirmation_number = None
+        self.save = Mock()
+        self.delete = Mock()
+
+    def __str__(self):
+        return "Appointment"
 
 
 class TestAppointmentRepository:
@@ -16,135 +32,182 @@ class TestAppointmentRepository:
     methods using the unittest.mock library to mock Django's ORM interactions, allowing isolated and controlled testing.
 
     Fixtures:
-        mock_appointment: Provides a mocked instance of the Appointment model.
-        appointment_repository: Provides an instance of the AppointmentRepository class for testing.
+        mock_transaction: Replaces the transaction module, so savepoints do not reach the database.
+        mock_appointment: Provides a stand-in instance of the Appointment model.
+        appointment_repository: Provides an instance of the AppointmentRepository class for testing, shared across the module.
+        appointment_data: Provides placeholder appointment data for the create tests.
+        fake_manager: Replaces Appointment.objects with a stand-in manager whose methods tests configure directly.
 
     Tests:
         - test_get_appointment_by_id
-        - test_get_appointment_by_id_not_found
+        - test_get_appointment_for_update
         - test_get_all_appointments
+        - test_iter_all_appointments
         - test_create_appointment
         - test_create_appointment_invalid_data
         - test_update_appointment
         - test_update_appointment_with_invalid_data
-        - test_update_appointment_not_found
         - test_delete_appointment
-        - test_delete_appointment_not_found
+        - test_appointment_not_found
+        - test_appointment_id_malformed
 
-    The tests utilize unittest.mock to patch Django ORM methods, allowing for the simulation of database interactions without
+    The tests utilize a stand-in for the Appointment manager in place of Django ORM methods, allowing for the simulation of database interactions without
     requiring an actual database. This approach provides faster and more reliable tests by isolating the repository logic
     from the database layer.
 
     By running this test suite, we can ensure that the AppointmentRepository class functions correctly and adheres to its expected
     behavior, maintaining the integrity and reliability of appointment data operations in the application.
     """
+    @pytest.fixture(autouse=True)
+    def mock_transaction(self, patch_transaction):
+        """Replaces the transaction module used by AppointmentRepository, as these tests do not access the database."""
+        return patch_transaction('appointments.repositories.appointment_repository')
+
     @pytest.fixture
     def mock_appointment(self):
-        """A mock object for the Appointment model."""
-        return MagicMock(spec=Appointment)
+        """A stand-in for an Appointment instance, returned by the mocked ORM."""
+        return FakeAppointment()
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def appointment_repository(self):
         """An instance of AppointmentRepository."""
+        # Imported here, like the model in fake_manager, so that collecting this module does not import the ORM layer.
+        from appointments.repositories.appointment_repository import AppointmentRepository
         return AppointmentRepository()
-    
-    def test_get_appointment_by_id(self, mock_appointment, appointment_repository):
-        """Ensures that the get_appointment_by_id method retrieves an appointment by ID correctly."""
-        appointment_id = 'some-unique-id'
-        with patch.object(Appointment.objects, 'get', return_value=mock_appointment) as mock_get:
-            appointment = appointment_repository.get_appointment_by_id(appointment_id)
-            mock_get.assert_called_once_with(id=appointment_id)
-            assert appointment == mock_appointment
-
-    def test_get_appointment_by_id_not_found(self, appointment_repository):
-        """Ensures that the get_appointment_by_id method handles the case where a appointment is not found."""
-        appointment_id = 'some-unique-id'
-        with patch.object(Appointment.objects, 'get', side_effect=Appointment.DoesNotExist):
-            appointment = appointment_repository.get_appointment_by_id(appointment_id)
-            assert appointment is None
-
-    def test_get_all_appointments(self, mock_appointment, appointment_repository):
-        """Ensures that the get_all_appointments method retrieves all appointments correctly."""
-        mock_appointments = [mock_appointment, mock_appointment]
-        with patch.object(Appointment.objects, 'all', return_value=mock_appointments) as mock_all:
-            appointments = appointment_repository.get_all_appointments()
-            mock_all.assert_called_once()
-            assert appointments == mock_appointments
 
-    def test_create_appointment(self, mock_appointment, appointment_repository):
-        """Ensures that the create_appointment method handles appointment creation correctly."""
-        appointment_data = {
+    @pytest.fixture
+    def appointment_data(self):
+        """Placeholder appointment data, returned as a new dict for each test so tests may modify it."""
+        return {
             'starts_at': 'The start time of the appointment',
             'ends_at': 'The end time of the appointment',
             'status': 'The current status of the appointment',
             'user': 'The associated user',
             'service': 'The associated service',
         }
-        with patch.object(Appointment.objects, 'create', return_value=mock_appointment) as mock_create:
-            appointment = appointment_repository.create_appointment(appointment_data)
-            mock_create.assert_called_once_with(**appointment_data)
-            assert appointment == mock_appointment
 
-    def test_create_appointment_invalid_data(self, appointment_repository):
-        """Ensures that create_appointment handles IntegrityError correctly."""
-        appointment_data = {
-            'starts_at': 'The start time of the appointment',
-            'ends_at': 'The end time of the appointment',
-            'status': 'The current status of the appointment',
-            'user': None, # This should trigger an IntegrityError due to not null constraint
-            'service': 'The associated service',
-        }
-        with patch.object(Appointment.objects, 'create', side_effect=IntegrityError) as mock_create:
-            appointment = appointment_repository.create_appointment(appointment_data)
-            mock_create.assert_called_once_with(**appointment_data)
-            assert not appointment
-
-    def test_update_appointment(self, mock_appointment, appointment_repository):
-        """Ensures that the update_appointment method updates a appointment's details correctly."""
-        appointment_id = 'some-unique-id'
+    @pytest.fixture
+    def fake_manager(self, patch_manager):
+        """Replaces Appointment.objects with a manager of plain mocks for the duration of a test (see conftest.py)."""
+        return patch_manager(
+            'appointments.models.Appointment', 'filter', 'select_related', 'select_for_update', 'create', 'bulk_create'
+        )
+
+    def test_get_appointment_by_id(self, mock_appointment, appointment_repository, fake_manager):
+        """Ensures that the get_appointment_by_id method retrieves an appointment by ID correctly."""
+        appointment_id = uuid.uuid4()
+        fake_manager.filter.return_value.first.return_value = mock_appointment
+        appointment = appointment_repository.get_appointment_by_id(appointment_id)
+        fake_manager.filter.assert_called_once_with(pk=appointment_id)
+        assert appointment == mock_appointment
+
+    def test_get_appointment_for_update(self, mock_appointment, appointment_repository, fake_manager):
+        """Ensures that get_appointment_for_update locks and retrieves the appointment."""
+        appointment_id = uuid.uuid4()
+        mock_queryset = fake_manager.select_for_update.return_value
+        mock_queryset.filter.return_value.first.return_value = mock_appointment
+        appointment = appointment_repository.get_appointment_for_update(appointment_id)
+        fake_manager.select_for_update.assert_called_once_with()
+        mock_queryset.filter.assert_called_once_with(pk=appointment_id)
+        assert appointment == mock_appointment
+
+    def test_get_all_appointments(self, mock_appointment, appointment_repository, fake_manager):
+        """Ensures that the get_all_appointments method retrieves all appointments correctly."""
+        mock_appointments = [mock_appointment, mock_appointment]
+        fake_manager.select_related.return_value = mock_appointments
+        appointments = appointment_repository.get_all_appointments()
+        fake_manager.select_related.assert_called_once_with('user', 'service')
+        assert appointments == mock_appointments
+
+    def test_iter_all_appointments(self, mock_appointment, appointment_repository, fake_manager):
+        """Ensures that the iter_all_appointments method streams all appointments in chunks."""
+        mock_appointments = iter([mock_appointment, mock_appointment])
+        mock_queryset = fake_manager.select_related.return_value
+        mock_queryset.iterator.return_value = mock_appointments
+        appointments = appointment_repository.iter_all_appointments()
+        fake_manager.select_related.assert_called_once_with('user', 'service')
+        mock_queryset.iterator.assert_called_once_with(chunk_size=2000)
+        assert appointments is mock_appointments
+
+    def test_create_appointment(self, mock_appointment, appointment_repository, fake_manager, appointment_data):
+        """Ensures that the create_appointment method handles appointment creation correctly."""
+        fake_manager.create.return_value = mock_appointment
+        appointment = appointment_repository.create_appointment(appointment_data)
+        fake_manager.create.assert_called_once_with(**appointment_data)
+        assert appointment == mock_appointment
+
+    def test_create_appointment_invalid_data(self, appointment_repository, fake_manager, appointment_data):
+        """Ensures that create_appointment lets an IntegrityError propagate for the service to report."""
+        appointment_data['user'] = None # This should trigger an IntegrityError due to not null constraint
+        fake_manager.create.side_effect = IntegrityError
+        with pytest.raises(IntegrityError):
+            appointment_repository.create_appointment(appointment_data)
+        fake_manager.create.assert_called_once_with(**appointment_data)
+
+    def test_update_appointment(self, mock_appointment, appointment_repository, fake_manager):
+        """Ensures that the update_appointment method updates an appointment with a single UPDATE query."""
+        appointment_id = uuid.uuid4()
         appointment_data = {
             'status': 'new status'
         }
-        assert mock_appointment.status != appointment_data["status"]
-        with patch.object(Appointment.objects, 'get', return_value=mock_appointment):
-            updated_appointment = appointment_repository.update_appointment(appointment_id, appointment_data)
-            for key, value in appointment_data.items():
-                setattr(mock_appointment, key, value)
-            mock_appointment.save.assert_called_once()
-            assert updated_appointment == mock_appointment
-            assert updated_appointment.status == appointment_data["status"]
-
-    def test_update_appointment_with_invalid_data(self, appointment_repository):
-        """Ensures that update_appointment handles IntegrityError correctly."""
-        appointment_id = 'some-unique-id'
+        mock_queryset = fake_manager.filter.return_value
+        mock_queryset.update.return_value = 1
+        fake_manager.select_related.return_value.get.return_value = mock_appointment
+        updated_appointment = appointment_repository.update_appointment(appointment_id, appointment_data)
+        fake_manager.filter.assert_called_once_with(pk=appointment_id)
+        mock_queryset.update.assert_called_once_with(**appointment_data)
+        fake_manager.select_related.return_value.get.assert_called_once_with(pk=appointment_id)
+        assert updated_appointment == mock_appointment
+
+    def test_update_appointment_with_invalid_data(self, appointment_repository, fake_manager):
+        """Ensures that update_appointment lets an IntegrityError propagate for the service to report."""
+        appointment_id = uuid.uuid4()
         invalid_appointment_data = {
             'status': 6,  # Assume this is an invalid status format
         }
-        with patch.object(Appointment.objects, 'get', side_effect=IntegrityError):
-            appointment = appointment_repository.update_appointment(appointment_id, invalid_appointment_data)
-            assert not appointment
-
-    def test_update_appointment_not_found(self, appointment_repository):
-        """Ensures that the update_appointment method handles the case where a appointment to be updated is not found."""
-        appointment_id = 'non-existent-id'
-        appointment_data = {
-            'email': 'newemail@example.com'
-        }
-        with patch.object(Appointment.objects, 'get', side_effect=Appointment.DoesNotExist):
-            updated_appointment = appointment_repository.update_appointment(appointment_id, appointment_data)
-            assert updated_appointment is None
+        fake_manager.filter.return_value.update.side_effect = IntegrityError
+        with pytest.raises(IntegrityError):
+            appointment_repository.update_appointment(appointment_id, invalid_appointment_data)
 
-    def test_delete_appointment(self, mock_appointment, appointment_repository):
+    def test_delete_appointment(self, appointment_repository, fake_manager):
         """Ensures that the delete_appointment method deletes a appointment by ID correctly."""
-        appointment_id = 'some-unique-id'
-        with patch.object(Appointment.objects, 'get', return_value=mock_appointment):
-            result = appointment_repository.delete_appointment(appointment_id)
-            mock_appointment.delete.assert_called_once()
-            assert result is True
-
-    def test_delete_appointment_not_found(self, appointment_repository):
-        """Ensures that the delete_appointment method handles the case where a appointment to be deleted is not found."""
-        appointment_id = 'non-existent-id'
-        with patch.object(Appointment.objects, 'get', side_effect=Appointment.DoesNotExist):
-            result = appointment_repository.delete_appointment(appointment_id)
-            assert result is False
+        appointment_id = uuid.uuid4()
+        mock_queryset = fake_manager.filter.return_value
+        mock_queryset.delete.return_value = (1, {'appointments.Appointment': 1})
+        result = appointment_repository.delete_appointment(appointment_id)
+        fake_manager.filter.assert_called_once_with(pk=appointment_id)
+        mock_queryset.delete.assert_called_once()
+        assert result is True
+
+    @pytest.mark.parametrize(
+            'method_name,args,expected',
+            [
+                ('get_appointment_by_id', (uuid.uuid4(),), None),
+                ('update_appointment', (uuid.uuid4(), {'status': 'completed'}), None),
+                ('delete_appointment', (uuid.uuid4(),), False),
+            ]
+    )
+    def test_appointment_not_found(self, appointment_repository, fake_manager, method_name, args, expected):
+        """Ensures that each method handles the case where the appointment is not found."""
+        mock_queryset = fake_manager.filter.return_value
+        mock_queryset.first.return_value = None
+        mock_queryset.update.return_value = 0
+        mock_queryset.delete.return_value = (0, {})
+        result = getattr(appointment_repository, method_name)(*args)
+        assert result is expected
+
+    @pytest.mark.parametrize(
+            'method_name,args,expected',
+            [
+                ('get_appointment_by_id', ('some-unique-id',), None),
+                ('get_appointment_for_update', ('some-unique-id',), None),
+                ('update_appointment', ('some-unique-id', {'status': 'completed'}), None),
+                ('delete_appointment', ('some-unique-id',), False),
+            ]
+    )
+    def test_appointment_id_malformed(self, appointment_repository, fake_manager, method_name, args, expected):
+        """Ensures that each method rejects an ID that is not a valid UUID without querying the database."""
+        result = getattr(appointment_repository, method_name)(*args)
+        fake_manager.filter.assert_not_called()
+        fake_manager.select_for_update.assert_not_called()
+        assert result is expected
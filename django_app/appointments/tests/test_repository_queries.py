@@ -0,0 +1,174 @@
+import pytest
+
+from datetime import datetime, timedelta
+from django.db import IntegrityError
+from django.utils.timezone import make_aware as make_aware_of_timezone
+
+from appointments.models import Appointment
+from appointments.repositories.appointment_repository import AppointmentRepository
+from services.models import Service
+from users.models import CustomUser
+
+
+@pytest.mark.django_db
+class TestAppointmentRepositoryQueries:
+    """
+    Test suite for the number of queries issued by the AppointmentRepository class.
+
+    Unlike TestAppointmentRepository, these tests run against the database so that the queries Django actually
+    issues can be counted, guarding against N+1 regressions when related entities are accessed.
+    """
+    created_at = make_aware_of_timezone(datetime.now())
+    updated_at = make_aware_of_timezone(datetime.now())
+    starts_at = make_aware_of_timezone(datetime.now() + timedelta(days=1))
+    ends_at = make_aware_of_timezone(datetime.now() + timedelta(days=1, hours=1))
+
+    def create_appointment_entity_dependencies(self, count):
+        """Creates `count` users and services for appointments to depend on, with one INSERT per model."""
+        users = CustomUser.objects.bulk_create([
+            CustomUser(
+                created_at=self.created_at,
+                updated_at=self.updated_at,
+                username=f'test_username_{i}',
+                email=f'test_email_{i}',
+                password='test_password'
+            )
+            for i in range(count)
+        ])
+        services = Service.objects.bulk_create([
+            Service(
+                created_at=self.created_at,
+                updated_at=self.updated_at,
+                name=f'Test Service Name {i}',
+                description='Test Service Description',
+                duration=60,
+                price=50
+            )
+            for i in range(count)
+        ])
+        return users, services
+
+    def create_appointments(self, count):
+        """Creates `count` appointments, each with its own user and service."""
+        users, services = self.create_appointment_entity_dependencies(count)
+        Appointment.objects.bulk_create([
+            Appointment(
+                created_at=self.created_at,
+                updated_at=self.updated_at,
+                starts_at=self.starts_at,
+                ends_at=self.ends_at,
+                status='scheduled',
+                user=user,
+                service=service,
+            )
+            for user, service in zip(users, services)
+        ])
+
+    def test_get_all_appointments_single_query(self, django_assert_num_queries):
+        """Ensures that accessing the user and service of every appointment does not issue a query per appointment."""
+        self.create_appointments(3)
+        appointment_repository = AppointmentRepository()
+
+        with django_assert_num_queries(1):
+            for appointment in appointment_repository.get_all_appointments():
+                assert appointment.user.username
+                assert appointment.service.name
+
+    def test_iter_all_appointments_single_query(self, django_assert_num_queries):
+        """Ensures that streaming appointments still fetches the related user and service in the same query."""
+        self.create_appointments(3)
+        appointment_repository = AppointmentRepository()
+
+        with django_assert_num_queries(1):
+            appointments = list(appointment_repository.iter_all_appointments())
+            for appointment in appointments:
+                assert appointment.user.username
+                assert appointment.service.name
+
+        assert len(appointments) == 3
+
+    def test_update_appointment_conflict_keeps_transaction_usable(self):
+        """Ensures that a conflicting update is rolled back to its savepoint, leaving the surrounding transaction usable."""
+        self.create_appointments(2)
+        first, second = Appointment.objects.order_by('id')
+        Appointment.objects.filter(pk=first.pk).update(confirmation_number=123456789)
+        appointment_repository = AppointmentRepository()
+
+        with pytest.raises(IntegrityError):
+            appointment_repository.update_appointment(second.id, {'confirmation_number': 123456789})
+
+        assert Appointment.objects.filter(confirmation_number=123456789).get().pk == first.pk
+
+    def test_create_appointment_duplicate_confirmation_number(self):
+        """
+        Ensures that a duplicate confirmation number raises an IntegrityError naming the constraint, as AppointmentService
+        relies on, and that the surrounding transaction stays usable.
+        """
+        [user], [service] = self.create_appointment_entity_dependencies(1)
+        appointment_data = {
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'starts_at': self.starts_at,
+            'ends_at': self.ends_at,
+            'status': 'scheduled',
+            'confirmation_number': 123456789,
+            'user': user,
+            'service': service,
+        }
+        appointment_repository = AppointmentRepository()
+        appointment_repository.create_appointment(appointment_data)
+
+        with pytest.raises(IntegrityError) as exc_info:
+            appointment_repository.create_appointment(appointment_data)
+
+        assert exc_info.value.__cause__.diag.constraint_name == 'appt_confirmation_number_unique'
+
+        assert Appointment.objects.count() == 1
+
+    def test_bulk_create_appointments_single_query(self, django_assert_num_queries):
+        """Ensures that bulk_create_appointments inserts a batch of appointments with a single INSERT."""
+        [user], [service] = self.create_appointment_entity_dependencies(1)
+        appointments_data = [
+            {
+                'created_at': self.created_at,
+                'updated_at': self.updated_at,
+                'starts_at': self.starts_at + timedelta(hours=i),
+                'ends_at': self.ends_at + timedelta(hours=i),
+                'status': 'scheduled',
+                'user': user,
+                'service': service,
+            }
+            for i in range(3)
+        ]
+        appointment_repository = AppointmentRepository()
+
+        # One INSERT, wrapped in a savepoint as the test already runs inside a transaction.
+        with django_assert_num_queries(3):
+            appointments = appointment_repository.bulk_create_appointments(appointments_data)
+
+        assert len(appointments) == 3
+        assert Appointment.objects.filter(user=user).count() == 3
+
+    def test_bulk_create_appointments_invalid_data(self):
+        """Ensures that bulk_create_appointments lets an IntegrityError propagate and persists none of the batch."""
+        [user], [service] = self.create_appointment_entity_dependencies(1)
+        appointments_data = [
+            {
+                'created_at': self.created_at,
+                'updated_at': self.updated_at,
+                'starts_at': self.starts_at,
+                'ends_at': self.ends_at,
+                'status': 'scheduled',
+                # Duplicate confirmation numbers should trigger an IntegrityError due to the unique constraint
+                'confirmation_number': 123456789,
+                'user': user,
+                'service': service,
+            }
+            for _ in range(2)
+        ]
+        appointment_repository = AppointmentRepository()
+
+        with pytest.raises(IntegrityError):
+            appointment_repository.bulk_create_appointments(appointments_data)
+
+        assert not Appointment.objects.filter(user=user).exists()
@@ -1,11 +1,13 @@
 import pytest
 
 from django.core.exceptions import ValidationError
-from django.utils.timezone import make_aware as make_aware_of_timezone
-from unittest.mock import MagicMock
+from django.db import IntegrityError
+from django.utils.timezone import is_aware
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
 
-from appointments.services.appointment_service import AppointmentService
-from appointments.repositories.appointment_repository import AppointmentRepository
+from appointments.services.appointment_service import AppointmentService, appointment_service as shared_appointment_service
+from appointments.repositories.appointment_repository import appointment_repository
 from appointments.services.validators.appointment_service_validator import AppointmentServiceValidator
 
 
@@ -16,26 +18,88 @@ class TestAppointmentService:
     This test suite ensures that the AppointmentService class correctly implements business logic for appointment operations and
     uses the AppointmentServiceValidator for validation.
     """
+
+    @pytest.fixture(autouse=True)
+    def mock_transaction(self, monkeypatch):
+        """
+        Replaces the transaction module used by AppointmentService, as these tests do not access the database.
+        """
+        mock_transaction = MagicMock()
+        monkeypatch.setattr('appointments.services.appointment_service.transaction', mock_transaction)
+        return mock_transaction
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def appointment_service(self):
         """
         Provides an instance of AppointmentService with a mocked AppointmentRepository and AppointmentServiceValidator.
+
+        The mocks are specced with the names of the methods the service calls, rather than the classes themselves, so that
+        typos are still caught without introspecting the classes. The instance is shared across the module and reset after
+        each test.
         """
         service = AppointmentService()
-        service.appointment_repository = MagicMock(spec=AppointmentRepository)
-        service.validator = MagicMock(spec=AppointmentServiceValidator)
+        service.appointment_repository = Mock(spec=[
+            'get_appointment_by_id',
+            'get_appointment_for_update',
+            'get_all_appointments',
+            'create_appointment',
+            'update_appointment',
+            'delete_appointment',
+        ])
+        service.validator = Mock(spec=[
+            'validate_appointment_exists',
+            'validate_appointment_data',
+        ])
         return service
 
-    def test_create_appointment_calls_validator(self, appointment_service):
+    @pytest.fixture
+    def appointment_data(self):
         """
-        Ensures that the create_appointment method calls the validator.
+        Provides appointment data shared by the create and update tests.
+
+        A new dict is returned for each test, as the service adds timestamps to the data it is given.
         """
-        appointment_data = {
+        return {
             'starts_at': 'some date',
             'ends_at': 'some other date',
             'status': 'scheduled',
         }
+
+    @pytest.fixture(autouse=True)
+    def reset_mocks(self, appointment_service):
+        """Resets the shared mocks after each test so no calls or configured values leak between tests."""
+        yield
+        appointment_service.appointment_repository.reset_mock(return_value=True, side_effect=True)
+        appointment_service.validator.reset_mock(return_value=True, side_effect=True)
+
+    @staticmethod
+    def constraint_violation(constraint_name):
+        """Builds an IntegrityError caused by a driver error naming `constraint_name`, as psycopg's errors do."""
+        cause = Exception(f"violates {constraint_name}")
+        cause.diag = SimpleNamespace(constraint_name=constraint_name)
+        error = IntegrityError(f"violates {constraint_name}")
+        error.__cause__ = cause
+        return error
+
+    def test_shared_repository(self):
+        """
+        Ensures that every AppointmentService reuses the module level AppointmentRepository.
+        """
+        service = AppointmentService()
+
+        assert service.appointment_repository is appointment_repository
+
+    def test_shared_service(self):
+        """
+        Ensures that a module level AppointmentService, with its validator, is available for reuse across requests.
+        """
+        assert isinstance(shared_appointment_service, AppointmentService)
+        assert isinstance(shared_appointment_service.validator, AppointmentServiceValidator)
+
+    def test_create_appointment_calls_validator(self, appointment_service, appointment_data):
+        """
+        Ensures that the create_appointment method calls the validator.
+        """
         appointment_service.validator.validate_appointment_data.return_value = None
         appointment_service.appointment_repository.create_appointment.return_value = appointment_data
 
@@ -44,15 +108,51 @@ class TestAppointmentService:
         appointment_service.validator.validate_appointment_data.assert_called_once_with(appointment_data)
         appointment_service.appointment_repository.create_appointment.assert_called_once_with(appointment_data)
 
-    def test_create_appointment_validation_error(self, appointment_service):
+    def test_create_appointment_returns_appointment(self, appointment_service, appointment_data):
+        """
+        Ensures that the create_appointment method returns the created appointment.
+        """
+        created_appointment = object()
+        appointment_service.appointment_repository.create_appointment.return_value = created_appointment
+
+        assert appointment_service.create_appointment(appointment_data) is created_appointment
+
+    def test_create_appointment_duplicate_confirmation_number(self, appointment_service, appointment_data):
+        """
+        Ensures that the create_appointment method reports a duplicate confirmation number, which only the database checks.
+        """
+        appointment_data['confirmation_number'] = 123456789
+        appointment_service.appointment_repository.create_appointment.side_effect = self.constraint_violation(
+            'appt_confirmation_number_unique'
+        )
+
+        with pytest.raises(ValidationError, match="Appointment with confirmation number 123456789 already exists."):
+            appointment_service.create_appointment(appointment_data)
+
+    def test_create_appointment_unknown_constraint(self, appointment_service, appointment_data):
+        """
+        Ensures that the create_appointment method reports the violation of a constraint it has no message for as is.
+        """
+        appointment_service.appointment_repository.create_appointment.side_effect = self.constraint_violation(
+            'some_other_constraint'
+        )
+
+        with pytest.raises(ValidationError, match="Error creating appointment: violates some_other_constraint"):
+            appointment_service.create_appointment(appointment_data)
+
+    def test_create_appointment_sets_timestamps(self, appointment_service, appointment_data):
+        """
+        Ensures that the create_appointment method stamps created_at and updated_at with the same aware datetime.
+        """
+        appointment_service.create_appointment(appointment_data)
+
+        assert appointment_data['created_at'] == appointment_data['updated_at']
+        assert is_aware(appointment_data['created_at'])
+
+    def test_create_appointment_validation_error(self, appointment_service, appointment_data):
         """
         Ensures that the create_appointment method raises a ValidationError when validation fails.
         """
-        appointment_data = {
-            'starts_at': 'some date',
-            'ends_at': 'some other date',
-            'status': 'scheduled',
-        }
         appointment_service.validator.validate_appointment_data.side_effect = ValidationError("Both starts_at and ends_at are required.")
 
         with pytest.raises(ValidationError, match="Both starts_at and ends_at are required."):
@@ -76,17 +176,12 @@ class TestAppointmentService:
         appointment_service.appointment_repository.get_appointment_by_id.assert_called_once_with(appointment_id)
         assert appointment['id'] == appointment_id
 
-    def test_update_appointment_calls_validator(self, appointment_service):
+    def test_update_appointment_calls_validator(self, appointment_service, appointment_data):
         """
         Ensures that the update_appointment method calls the validator.
         """
         appointment_id = 'some-unique-id'
-        appointment_data = {
-            'id': appointment_id,
-            'starts_at': 'some date',
-            'ends_at': 'some other date',
-            'status': 'scheduled',
-        }
+        appointment_data = {'id': appointment_id, **appointment_data}
         appointment_service.validator.validate_appointment_data.return_value = None
         appointment_service.appointment_repository.update_appointment.return_value = appointment_data
 
@@ -95,6 +190,20 @@ class TestAppointmentService:
         appointment_service.validator.validate_appointment_data.assert_called_once_with(appointment_data, is_update=True)
         appointment_service.appointment_repository.update_appointment.assert_called_once_with(appointment_id, appointment_data)
 
+    def test_update_appointment_in_transaction(self, appointment_service, mock_transaction):
+        """
+        Ensures that the update_appointment method locks the appointment and updates it within a single transaction.
+        """
+        appointment_id = 'some-unique-id'
+        appointment_data = {'status': 'completed'}
+
+        appointment_service.update_appointment(appointment_id, appointment_data)
+
+        mock_transaction.atomic.assert_called_once_with()
+        mock_transaction.atomic.return_value.__exit__.assert_called_once()
+        appointment_service.appointment_repository.get_appointment_for_update.assert_called_once_with(appointment_id)
+        appointment_service.appointment_repository.get_appointment_by_id.assert_not_called()
+
     def test_update_appointment_validation_error(self, appointment_service):
         """
         Ensures that the update_appointment method raises a ValidationError when validation fails.
@@ -106,6 +215,17 @@ class TestAppointmentService:
         with pytest.raises(ValidationError, match="End time cannot be earlier than end time"):
             appointment_service.update_appointment(appointment_id, appointment_data)
 
+    def test_update_appointment_conflict(self, appointment_service):
+        """
+        Ensures that the update_appointment method reports a conflicting update as a ValidationError.
+        """
+        appointment_service.appointment_repository.update_appointment.side_effect = self.constraint_violation(
+            'appt_confirmation_number_unique'
+        )
+
+        with pytest.raises(ValidationError, match="Appointment with confirmation number 123456789 already exists."):
+            appointment_service.update_appointment('some-unique-id', {'confirmation_number': 123456789})
+
     def test_delete_appointment(self, appointment_service):
         """
         Ensures that the delete_appointment method deletes an appointment by ID correctly.
@@ -115,6 +235,7 @@ class TestAppointmentService:
 
         result = appointment_service.delete_appointment(appointment_id)
 
+        appointment_service.appointment_repository.get_appointment_by_id.assert_not_called()
         appointment_service.appointment_repository.delete_appointment.assert_called_once_with(appointment_id)
         assert result is True
 
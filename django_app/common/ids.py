@@ -0,0 +1,14 @@
+import uuid
+
+
+def is_valid_uuid(value):
+    """
+    Returns whether `value` is a UUID, or a string holding one.
+
+    Repositories use this to return early for malformed IDs, which cannot match any row, without querying the database.
+    """
+    try:
+        uuid.UUID(str(value))
+    except ValueError:
+        return False
+    return True
@@ -1,6 +1,43 @@
 import os
 import django
+import pytest
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'django_app.settings')
 # Ensure django is setup before any tests run
 django.setup()
+
+
+@pytest.fixture
+def patch_manager(monkeypatch):
+    """
+    Returns a function that replaces the manager of a model with one of plain mocks for the duration of a test.
+
+    It takes the dotted path of the model and the names of the ORM methods the tests configure, and returns the
+    stand-in manager. A single swap per test avoids entering a patch.object context for each ORM method a test touches.
+    """
+    from types import SimpleNamespace
+    from unittest.mock import Mock
+
+    def patch(model_path, *method_names):
+        manager = SimpleNamespace(**{method_name: Mock() for method_name in method_names})
+        monkeypatch.setattr(f'{model_path}.objects', manager)
+        return manager
+
+    return patch
+
+
+@pytest.fixture
+def patch_transaction(monkeypatch):
+    """
+    Returns a function that replaces the transaction module imported by the given module with a mock, and returns it.
+
+    Used by the repository tests that mock the ORM, so that savepoints and commit callbacks do not reach the database.
+    """
+    from unittest.mock import MagicMock
+
+    def patch(module_path):
+        mock_transaction = MagicMock()
+        monkeypatch.setattr(f'{module_path}.transaction', mock_transaction)
+        return mock_transaction
+
+    return patch
@@ -81,7 +81,11 @@ DATABASES = {
         'USER': config('DB_USER'),
         'PASSWORD': config('DB_PASSWORD'),
         'HOST': config('DB_HOST'),
-        'PORT': config('DB_PORT')
+        'PORT': config('DB_PORT'),
+        # Keep connections open between requests rather than reconnecting for every request.
+        'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=60, cast=int),
+        # Check a persistent connection is still usable before reusing it for a new request.
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
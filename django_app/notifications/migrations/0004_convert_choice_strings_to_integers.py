@@ -0,0 +1,46 @@
+# Generated by Django 5.0.4 on 2026-10-15 22:47
+
+from django.db import migrations
+
+# The string values previously stored in each column, mapped to their new integer values.
+CHOICES = {
+    'type': {'email': 0, 'sms': 1, 'in_app': 2},
+    'status': {'pending': 0, 'sent': 1, 'failed': 2},
+    'priority': {'low': 0, 'medium': 1, 'high': 2},
+}
+
+
+def strings_to_integers(apps, schema_editor):
+    """
+    Rewrites each string value as its integer, still stored as text, so the columns can then be cast to smallint
+    by the following migration.
+
+    Values outside the known choices are left untouched and will cause that column type change to fail.
+    """
+    Notification = apps.get_model('notifications', 'Notification')
+    for field, mapping in CHOICES.items():
+        for label, value in mapping.items():
+            Notification.objects.filter(**{field: label}).update(**{field: str(value)})
+
+
+def integers_to_strings(apps, schema_editor):
+    """Reverses strings_to_integers, once the columns have been cast back to text."""
+    Notification = apps.get_model('notifications', 'Notification')
+    for field, mapping in CHOICES.items():
+        for label, value in mapping.items():
+            Notification.objects.filter(**{field: str(value)}).update(**{field: label})
+
+
+class Migration(migrations.Migration):
+    """
+    Kept separate from the column type change, as PostgreSQL cannot alter a table with pending deferred constraint
+    checks from rows updated in the same transaction.
+    """
+
+    dependencies = [
+        ('notifications', '0003_add_notification_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(strings_to_integers, integers_to_strings),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.0.4 on 2026-10-15 22:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0004_convert_choice_strings_to_integers'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='notification',
+            name='priority',
+            field=models.PositiveSmallIntegerField(choices=[(0, 'low'), (1, 'medium'), (2, 'high')]),
+        ),
+        migrations.AlterField(
+            model_name='notification',
+            name='status',
+            field=models.PositiveSmallIntegerField(choices=[(0, 'pending'), (1, 'sent'), (2, 'failed')], default=0),
+        ),
+        migrations.AlterField(
+            model_name='notification',
+            name='type',
+            field=models.PositiveSmallIntegerField(choices=[(0, 'email'), (1, 'sms'), (2, 'in_app')]),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.0.4 on 2026-10-15 22:52
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0003_add_confirmation_number_check'),
+        ('notifications', '0006_add_id_to_user_recent_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='notification',
+            constraint=models.CheckConstraint(check=models.Q(('type__in', [0, 1, 2])), name='notif_type_valid'),
+        ),
+        migrations.AddConstraint(
+            model_name='notification',
+            constraint=models.CheckConstraint(check=models.Q(('status__in', [0, 1, 2])), name='notif_status_valid'),
+        ),
+        migrations.AddConstraint(
+            model_name='notification',
+            constraint=models.CheckConstraint(check=models.Q(('priority__in', [0, 1, 2])), name='notif_priority_valid'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.0.4 on 2026-10-15 22:53
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0003_add_confirmation_number_check'),
+        ('notifications', '0007_add_choice_check_constraints'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='notification',
+            constraint=models.UniqueConstraint(condition=models.Q(('appointment__isnull', False)), fields=('user', 'appointment', 'type', 'scheduled_send_datetime'), name='notif_dedup'),
+        ),
+    ]
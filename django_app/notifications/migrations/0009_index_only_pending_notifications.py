@@ -0,0 +1,24 @@
+# Generated by Django 5.0.4 on 2026-10-15 22:54
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0003_add_confirmation_number_check'),
+        ('notifications', '0008_add_reminder_dedup_constraint'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='notification',
+            name='notif_due_idx',
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(condition=models.Q(('status', 0)), fields=['scheduled_send_datetime'], name='notif_pending_due_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.0.4 on 2026-10-15 22:54
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0003_add_confirmation_number_check'),
+        ('notifications', '0009_index_only_pending_notifications'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='notification',
+            name='notif_status_valid',
+        ),
+        migrations.AlterField(
+            model_name='notification',
+            name='status',
+            field=models.PositiveSmallIntegerField(choices=[(0, 'pending'), (1, 'sent'), (2, 'failed'), (3, 'sending')], default=0),
+        ),
+        migrations.AddConstraint(
+            model_name='notification',
+            constraint=models.CheckConstraint(check=models.Q(('status__in', [0, 1, 2, 3])), name='notif_status_valid'),
+        ),
+    ]
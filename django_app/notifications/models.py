@@ -4,6 +4,26 @@ from django.db import models
 from appointments.models import Appointment
 from users.models import CustomUser
 
+# The choices are defined at module level so that Notification.Meta can reference them in its constraints.
+class NotificationType(models.IntegerChoices):
+    EMAIL = 0, 'email'
+    SMS = 1, 'sms'
+    IN_APP = 2, 'in_app'
+
+
+class NotificationStatus(models.IntegerChoices):
+    PENDING = 0, 'pending'
+    SENT = 1, 'sent'
+    FAILED = 2, 'failed'
+    SENDING = 3, 'sending'
+
+
+class NotificationPriority(models.IntegerChoices):
+    LOW = 0, 'low'
+    MEDIUM = 1, 'medium'
+    HIGH = 2, 'high'
+
+
 class Notification(models.Model):
     """
     Represents messages or alerts sent to users to inform them about important events or actions
@@ -13,13 +33,17 @@ class Notification(models.Model):
         id (UUIDField): A unique identifier for each notification.
         created_at (DateTimeField): The timestamp when the notification was created.
         updated_at (DateTimeField): The timestamp when the notification was last updated.
-        type (CharField): The type of notification to be sent, e.g., 'email', 'sms', 'in_app'.
-        status (CharField): The current status of the notification, e.g., 'pending', 'sent', 'failed'.
+        type (PositiveSmallIntegerField): The type of notification to be sent, one of Notification.Type
+            ('email', 'sms', 'in_app').
+        status (PositiveSmallIntegerField): The current status of the notification, one of Notification.Status
+            ('pending', 'sent', 'failed', 'sending'). Defaults to 'pending'. A notification is 'sending' once a worker has
+            claimed it, until the outcome is recorded.
         subject (CharField): A title for the message, nullable.
         message (CharField): The content of the notification.
         scheduled_send_datetime (DateTimeField): The timestamp when the notification is scheduled to be sent.
         actual_sent_datetime (DateTimeField): The timestamp when the notification was sent, nullable.
-        priority (CharField): The priority of the notification, e.g., 'low', 'medium', 'high'.
+        priority (PositiveSmallIntegerField): The priority of the notification, one of Notification.Priority
+            ('low', 'medium', 'high').
         channel_specific_info (JSONField): Additional information specific to the notification channel, such as email subject
             or SMS sender ID, nullable.
         response (CharField): The response received from the notification service. This can be useful for debugging any issues. 
@@ -30,20 +54,37 @@ class Notification(models.Model):
         - many-to-one with CustomUser
         - many-to-one with Appointment, nullable
 
+    ## Indexes
+    - (scheduled_send_datetime), partial on pending notifications: notifications that are due to be sent. Sent and
+      failed notifications are left out, so the index stays small however many notifications accumulate.
+    - (user, -created_at, -id): a user's most recent notifications, paginated by (created_at, id).
+    - (user, appointment, type, scheduled_send_datetime), unique where appointment is set: deduplicates reminders
+      enqueued more than once, for example by retries.
+
+    ## Choices
+    type, status and priority are stored as small integers rather than strings, keeping rows and the indexes on
+    these columns narrow. Use the Type, Status and Priority choices below rather than raw integers.
+    Check constraints restrict each column to the values of its choices, so out of range integers are rejected by
+    the database.
+
     ## Validation
     Only database level validation should be defined in this class.
     """
+    Type = NotificationType
+    Status = NotificationStatus
+    Priority = NotificationPriority
+
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     created_at = models.DateTimeField(auto_now_add=True, null=False)
     updated_at = models.DateTimeField(auto_now=True, null=False)
 
-    type = models.CharField(max_length=20, null=False)
-    status = models.CharField(max_length=20, null=False)
+    type = models.PositiveSmallIntegerField(choices=Type.choices, null=False)
+    status = models.PositiveSmallIntegerField(choices=Status.choices, default=Status.PENDING, null=False)
     subject = models.CharField(max_length=50, null=True)
     message = models.CharField(max_length=500, null=False)
     scheduled_send_datetime = models.DateTimeField(null=False)
     actual_sent_datetime = models.DateTimeField(null=True)
-    priority = models.CharField(max_length=20, null=False)
+    priority = models.PositiveSmallIntegerField(choices=Priority.choices, null=False)
     channel_specific_info = models.JSONField(null=True)
     response =  models.CharField(max_length=500, null=True)
 
@@ -60,3 +101,24 @@ class Notification(models.Model):
         related_name='notifications',
         null=True
     )
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['scheduled_send_datetime'],
+                condition=models.Q(status=NotificationStatus.PENDING),
+                name='notif_pending_due_idx',
+            ),
+            models.Index(fields=['user', '-created_at', '-id'], name='notif_user_recent_idx'),
+        ]
+        constraints = [
+            models.CheckConstraint(check=models.Q(type__in=NotificationType.values), name='notif_type_valid'),
+            models.CheckConstraint(check=models.Q(status__in=NotificationStatus.values), name='notif_status_valid'),
+            models.CheckConstraint(check=models.Q(priority__in=NotificationPriority.values), name='notif_priority_valid'),
+            # A reminder for an appointment is only sent once per type and time, however often it is enqueued.
+            models.UniqueConstraint(
+                fields=['user', 'appointment', 'type', 'scheduled_send_datetime'],
+                condition=models.Q(appointment__isnull=False),
+                name='notif_dedup',
+            ),
+        ]
@@ -6,14 +6,46 @@ class NotificationRepositoryInterface(ABC):
     def get_notification_by_id(self, notification_id):
         pass
 
+    @abstractmethod
+    async def aget_notification_by_id(self, notification_id):
+        pass
+
     @abstractmethod
     def get_all_notifications(self):
         pass
 
+    @abstractmethod
+    def aget_all_notifications(self):
+        pass
+
+    @abstractmethod
+    def list_notifications(self, *, after=None, limit=50, user_id=None):
+        pass
+
+    @abstractmethod
+    def list_summaries(self, **filters):
+        pass
+
+    @abstractmethod
+    def list_summary_values(self, **filters):
+        pass
+
     @abstractmethod
     def create_notification(self, notification_data):
         pass
 
+    @abstractmethod
+    def bulk_create_notifications(self, notifications_data):
+        pass
+
+    @abstractmethod
+    def bulk_update_status(self, notification_ids, status, actual_sent_datetime=None):
+        pass
+
+    @abstractmethod
+    def claim_due_batch(self, now, limit=100):
+        pass
+
     @abstractmethod
     def update_notification(self, notification_id, notification_data):
         pass
@@ -1,40 +1,121 @@
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
+from common.ids import is_valid_uuid
 from notifications.models import Notification
 from notifications.repositories.interfaces.notification_repository_interface import NotificationRepositoryInterface
 
+# The columns list views and workers need, leaving out the wide channel_specific_info and message columns.
+NOTIFICATION_SUMMARY_FIELDS = ('id', 'status', 'scheduled_send_datetime', 'priority', 'user_id', 'appointment_id')
+
 
 class NotificationRepository(NotificationRepositoryInterface):
     def get_notification_by_id(self, notification_id):
-        try:
-            return Notification.objects.get(id=notification_id)
-        except:
+        if not is_valid_uuid(notification_id):
             return None
+        return Notification.objects.select_related('user', 'appointment').filter(id=notification_id).first()
+
+    async def aget_notification_by_id(self, notification_id):
+        if not is_valid_uuid(notification_id):
+            return None
+        return await Notification.objects.select_related('user', 'appointment').filter(id=notification_id).afirst()
     
     def get_all_notifications(self):
-        return Notification.objects.all()
+        return Notification.objects.select_related('user', 'appointment')
+
+    def aget_all_notifications(self):
+        return Notification.objects.select_related('user', 'appointment').aiterator(chunk_size=500)
+
+    def list_notifications(self, *, after=None, limit=50, user_id=None):
+        notifications = Notification.objects.select_related('user', 'appointment')
+        if user_id:
+            notifications = notifications.filter(user_id=user_id)
+        if after:
+            # Keyset pagination: continue from the (created_at, id) of the last notification on the previous page,
+            # so every page costs an index range scan rather than an OFFSET walk over the preceding rows.
+            created_at, notification_id = after
+            notifications = notifications.filter(
+                Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=notification_id)
+            )
+        # One extra row is fetched to tell whether another page follows.
+        rows = list(notifications.order_by('-created_at', '-id')[:limit + 1])
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        return rows, (rows[-1].created_at, rows[-1].id)
+
+    def list_summaries(self, **filters):
+        # Accessing a deferred field, such as message, on a returned notification issues a query per notification.
+        return Notification.objects.filter(**filters).only(*NOTIFICATION_SUMMARY_FIELDS).select_related('user')
+
+    def list_summary_values(self, **filters):
+        # Dicts rather than model instances, for callers that only pass the values on.
+        return Notification.objects.filter(**filters).values(*NOTIFICATION_SUMMARY_FIELDS)
     
     def create_notification(self, notification_data):
         try:
             return Notification.objects.create(**notification_data)
         except IntegrityError:
             return None
+
+    def bulk_create_notifications(self, notifications_data):
+        try:
+            with transaction.atomic():
+                # Notifications duplicating an existing reminder are skipped by the database (see the notif_dedup
+                # constraint). They are still included in the returned list, but are not saved.
+                return Notification.objects.bulk_create(
+                    [Notification(**notification_data) for notification_data in notifications_data],
+                    batch_size=500,
+                    ignore_conflicts=True,
+                )
+        except IntegrityError:
+            return None
+
+    def bulk_update_status(self, notification_ids, status, actual_sent_datetime=None):
+        # update() bypasses auto_now, so updated_at is set explicitly.
+        updated_count = Notification.objects.filter(id__in=notification_ids).update(
+            status=status,
+            actual_sent_datetime=actual_sent_datetime,
+            updated_at=timezone.now(),
+        )
+        return updated_count
     
+    def claim_due_batch(self, now, limit=100):
+        # Claims up to `limit` pending notifications due by `now` for sending, in a single statement. Rows locked by
+        # another worker's claim are skipped rather than waited on, so concurrent workers claim disjoint batches.
+        table = Notification._meta.db_table
+        return list(Notification.objects.raw(
+            f"""
+            UPDATE {table} SET status = %s, updated_at = %s
+            WHERE id IN (
+                SELECT id FROM {table}
+                WHERE status = %s AND scheduled_send_datetime <= %s
+                ORDER BY scheduled_send_datetime
+                LIMIT %s
+                FOR UPDATE SKIP LOCKED
+            )
+            RETURNING *
+            """,
+            [Notification.Status.SENDING, timezone.now(), Notification.Status.PENDING, now, limit],
+        ))
+
     def update_notification(self, notification_id, notification_data):
-        try:
-            notification = Notification.objects.get(id=notification_id)
-            for key, value in notification_data.items():
-                setattr(notification, key, value)
-            notification.save()
-            return notification
-        except Notification.DoesNotExist:
+        if not is_valid_uuid(notification_id):
             return None
+        # update() bypasses auto_now, so updated_at is kept current unless the caller sets it.
+        notification_data = {'updated_at': timezone.now(), **notification_data}
+        try:
+            # Run in a savepoint, so that a failed update does not break a transaction the caller holds.
+            with transaction.atomic():
+                updated = Notification.objects.filter(id=notification_id).update(**notification_data)
         except IntegrityError:
             return None
+        if not updated:
+            return None
+        return Notification.objects.select_related('user', 'appointment').get(id=notification_id)
     
     def delete_notification(self, notification_id):
-        try:
-            notification = Notification.objects.get(id=notification_id)
-            notification.delete()
-            return True
-        except Notification.DoesNotExist:
-            return False
\ No newline at end of file
+        if not is_valid_uuid(notification_id):
+            return False
+        deleted_count, _ = Notification.objects.filter(id=notification_id).delete()
+        return deleted_count > 0
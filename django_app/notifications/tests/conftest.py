@@ -0,0 +1,44 @@
+import pytest
+from django.utils import timezone
+
+from notifications.repositories.notification_repository import NotificationRepository
+from users.models import CustomUser
+
+
+@pytest.fixture(scope='session')
+def notification_repository():
+    """
+    An instance of NotificationRepository, shared by every notification test.
+
+    The repository holds no state and no test modifies it, so it is constructed once per session.
+    """
+    return NotificationRepository()
+
+
+@pytest.fixture(scope='class')
+def notification_user(django_db_setup, django_db_blocker):
+    """
+    Creates the user required by the Notification entity once per test class.
+
+    Each test runs in its own transaction, so the notifications it creates are rolled back while the user, created
+    outside of those transactions, is shared by the whole class and deleted once the class has finished.
+
+    As the user is committed, it would outlive an interrupted run in the reused test database, so it is deleted even
+    when the class fails, and any user left behind by an earlier run is deleted before it is created again.
+    """
+    username = 'notification_test_username'
+    now = timezone.now()
+    with django_db_blocker.unblock():
+        CustomUser.objects.filter(username=username).delete()
+        user = CustomUser.objects.create(
+            created_at=now,
+            updated_at=now,
+            username=username,
+            email='notification_test_email',
+            password='test_password'
+        )
+    try:
+        yield user
+    finally:
+        with django_db_blocker.unblock():
+            CustomUser.objects.filter(pk=user.pk).delete()
@@ -7,63 +7,48 @@ import pytest
 
 from appointments.models import Appointment
 from services.models import Service
-from users.models import CustomUser
 from notifications.models import Notification
 
 @pytest.mark.django_db
 class TestNotification:
-    """This tests the Notification entity at the database level."""
+    """
+    This tests the Notification entity at the database level.
+
+    The user every notification requires is provided by the class scoped `notification_user` fixture.
+    """
+    # A fixed timestamp keeps the field values deterministic and is localized once for the whole class.
+    _FIXED_NOW = make_aware_of_timezone(datetime(2024, 1, 1, 12, 0, 0))
+
     # Field values - Generic
-    created_at = make_aware_of_timezone(datetime.now())
-    updated_at = make_aware_of_timezone(datetime.now())
+    created_at = _FIXED_NOW
+    updated_at = _FIXED_NOW
 
     # Field values - Notification entity
     notification_id = uuid.uuid4()
-    notification_type = 'test_type'
-    notification_status = 'test_status'
+    notification_type = Notification.Type.EMAIL
+    notification_status = Notification.Status.SENT
     notification_message = 'test message'
-    notification_scheduled_send_datetime = make_aware_of_timezone(datetime.now())
-    notification_priority = 'test_priority'
+    notification_scheduled_send_datetime = _FIXED_NOW
+    notification_priority = Notification.Priority.LOW
 
     # Field values - Dependency objects:
-    ## User
-    username = 'test_username'
-    email = 'test_email'
-    password = 'test_password'
     ## Service
     name = 'Test Service Name'
     description = 'Test Service Description'
     duration = 60
     price = 50
     ## Appointment
-    starts_at = make_aware_of_timezone(datetime.now() + timedelta(days=1))
-    ends_at = make_aware_of_timezone(datetime.now() + timedelta(days=1, hours=1))
+    starts_at = _FIXED_NOW + timedelta(days=1)
+    ends_at = _FIXED_NOW + timedelta(days=1, hours=1)
     appointment_status = 'test_status'
 
-    def create_notification_entity_dependencies(self):
-        """
-        Creates the required foreign entities to allow notification entity creation.
-
-        Returns: User
-        """
-
-        user = CustomUser.objects.create(
-            created_at=self.created_at,
-            updated_at=self.updated_at,
-            username=self.username,
-            email=self.email,
-            password=self.password
-        )
-
-        return user
-    
-    def test_minimal_required_fields_present(self):
+    def test_minimal_required_fields_present(self, notification_user):
         """
         Test the minimal fields needed to create the Notification entity.
 
         Some of the required fields have default values, this test confirms they are present post creation.
         """
-        user = self.create_notification_entity_dependencies()
+        user = notification_user
         notification = Notification.objects.create(
             type=self.notification_type,
             status=self.notification_status,
@@ -81,6 +66,19 @@ class TestNotification:
         assert notification.priority == self.notification_priority
         assert notification.user == user
 
+    def test_status_defaults_to_pending(self, notification_user):
+        """Test that a notification is pending when no status is given."""
+        user = notification_user
+        notification = Notification.objects.create(
+            type=self.notification_type,
+            message=self.notification_message,
+            scheduled_send_datetime=self.notification_scheduled_send_datetime,
+            priority=self.notification_priority,
+            user=user
+        )
+        notification.refresh_from_db()
+        assert notification.status == Notification.Status.PENDING
+
     @pytest.mark.parametrize(
             'notification_id,created_at,updated_at,missing_value',
             [
@@ -89,7 +87,7 @@ class TestNotification:
                 (notification_id,created_at,None, 'updated_at'),
             ]
     )
-    def test_required_non_overridable_default_fields(self, notification_id, created_at, updated_at, missing_value):
+    def test_required_non_overridable_default_fields(self, notification_user, notification_id, created_at, updated_at, missing_value):
         """Ensure required fields with non-overridable default values are always populated.
 
         Certain fields are populated even if explicitly set as Null. This is an extra precaution as there is no
@@ -100,7 +98,7 @@ class TestNotification:
         - created_at
         - updated_at
         """
-        user = self.create_notification_entity_dependencies()
+        user = notification_user
 
         notification = Notification.objects.create(
             # Required fields - Non overridable defaults
@@ -131,6 +129,7 @@ class TestNotification:
     )
     def test_required_fields_missing(
             self, 
+            notification_user,
             notification_type, 
             notification_status, 
             notification_message, 
@@ -149,8 +148,7 @@ class TestNotification:
             - Add a new parameter above, following the pattern used.
             - Add a row in the 'create' query.
         """
-        user = self.create_notification_entity_dependencies()
-        user = user if existing_user else None
+        user = notification_user if existing_user else None
 
         with pytest.raises(IntegrityError) as missing_column_error:
             Notification.objects.create(
@@ -164,13 +162,43 @@ class TestNotification:
         assert 'violates not-null constraint' in str(missing_column_error._excinfo)
         assert f'null value in column "{missing_value}"' in str(missing_column_error)
 
-    def test_unique_constraint_violated(self):
+    @pytest.mark.parametrize(
+            'field,constraint_name',
+            [
+                ('type', 'notif_type_valid'),
+                ('status', 'notif_status_valid'),
+                ('priority', 'notif_priority_valid'),
+            ]
+    )
+    def test_check_constraint_violated(self, notification_user, field, constraint_name):
+        """
+        Each iteration attempts creation with a value which violates a 'check' constraint.
+
+        ALL 'check' constraints defined on the model should be tested here.
+        """
+        notification_data = {
+            'type': self.notification_type,
+            'status': self.notification_status,
+            'message': self.notification_message,
+            'scheduled_send_datetime': self.notification_scheduled_send_datetime,
+            'priority': self.notification_priority,
+            'user': notification_user,
+        }
+        # Tested field, set to a value outside of its choices
+        notification_data[field] = 99
+
+        with pytest.raises(IntegrityError) as check_constraint_violation_error:
+            Notification.objects.create(**notification_data)
+
+        assert f'violates check constraint "{constraint_name}"' in str(check_constraint_violation_error.value)
+
+    def test_unique_constraint_violated(self, notification_user):
         """
         Attempts creation with a duplicate 'unique' field.
 
         ALL fields with the 'unique' constraint set should be tested here (currently, this is just the primary key).
         """
-        user = self.create_notification_entity_dependencies()
+        user = notification_user
         notification = Notification.objects.create(
             type=self.notification_type,
             status=self.notification_status,
@@ -197,9 +225,49 @@ class TestNotification:
         assert (f"Key (id)=({getattr(notification, 'id')}) already exists"
                 in str(unique_contraint_violation_error))
 
-    def test_optional_relationship(self):
+    def test_dedup_constraint_violated(self, notification_user):
+        """
+        Attempts creation of a second reminder for the same appointment, type and scheduled time.
+
+        Notifications without an appointment are not deduplicated, so the same is allowed for those.
+        """
+        service = Service.objects.create(
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+            name=self.name,
+            description=self.description,
+            duration=self.duration,
+            price=self.price
+        )
+        appointment = Appointment.objects.create(
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+            starts_at=self.starts_at,
+            ends_at=self.ends_at,
+            status=self.appointment_status,
+            user=notification_user,
+            service=service,
+        )
+        notification_data = {
+            'type': self.notification_type,
+            'status': self.notification_status,
+            'message': self.notification_message,
+            'scheduled_send_datetime': self.notification_scheduled_send_datetime,
+            'priority': self.notification_priority,
+            'user': notification_user,
+        }
+        Notification.objects.create(**notification_data)
+        Notification.objects.create(**notification_data)
+        Notification.objects.create(appointment=appointment, **notification_data)
+
+        with pytest.raises(IntegrityError) as unique_contraint_violation_error:
+            Notification.objects.create(appointment=appointment, **notification_data)
+
+        assert 'duplicate key value violates unique constraint "notif_dedup"' in str(unique_contraint_violation_error.value)
+
+    def test_optional_relationship(self, notification_user):
         """Test that any optional relationships are correctly added upon creation"""
-        user = self.create_notification_entity_dependencies()
+        user = notification_user
         service = Service.objects.create(
             created_at=self.created_at,
             updated_at=self.updated_at,
@@ -1,10 +1,11 @@
 import pytest
+import uuid
 
 from django.db import IntegrityError
-from unittest.mock import MagicMock, patch
+from unittest.mock import sentinel
 
 from notifications.models import Notification
-from notifications.repositories.notification_repository import NotificationRepository
+
 
 class TestNotificationRepository:
     """
@@ -15,22 +16,22 @@ class TestNotificationRepository:
     methods using the unittest.mock library to mock Django's ORM interactions, allowing isolated and controlled testing.
 
     Fixtures:
-        mock_notification: Provides a mocked instance of the Notification model.
-        notification_repository: Provides an instance of the NotificationRepository class for testing.
+        mock_transaction: Replaces the transaction module, so transactions do not reach the database.
+        mock_notification: Provides a stand-in instance of the Notification model.
+        notification_repository: Provides an instance of the NotificationRepository class for testing, shared across the session (see conftest.py).
+        fake_manager: Replaces Notification.objects with a stand-in manager whose methods tests configure directly.
 
     Tests:
         - test_get_notification_by_id
-        - test_get_notification_by_id_not_found
+        - test_get_notification_by_id_malformed
         - test_get_all_notifications
         - test_create_notification
-        - test_create_notification_invalid_data
         - test_update_notification
-        - test_update_notification_with_invalid_data
-        - test_update_notification_not_found
         - test_delete_notification
-        - test_delete_notification_not_found
+        - test_notification_not_found
+        - test_notification_invalid_data
 
-    The tests utilize unittest.mock to patch Django ORM methods, allowing for the simulation of database interactions without
+    The tests utilize a stand-in for the Notification manager in place of Django ORM methods, allowing for the simulation of database interactions without
     requiring an actual database. This approach provides faster and more reliable tests by isolating the repository logic
     from the database layer.
 
@@ -38,115 +39,119 @@ class TestNotificationRepository:
     behavior, maintaining the integrity and reliability of notification data operations in the application.
     """
 
-    @pytest.fixture
+    @pytest.fixture(autouse=True)
+    def mock_transaction(self, patch_transaction):
+        """Replaces the transaction module used by NotificationRepository, as these tests do not access the database."""
+        return patch_transaction('notifications.repositories.notification_repository')
+
+    @pytest.fixture(scope="module")
     def mock_notification(self):
-        """A mock object for the Notification model."""
-        return MagicMock(spec=Notification)
+        """
+        A stand-in for a Notification instance, returned by the mocked ORM.
+
+        The tests only hand it through the mocked ORM and compare it by identity, so a sentinel serves.
+        """
+        return sentinel.notification
     
     @pytest.fixture
-    def notification_repository(self):
-        """An instance of NotificationRepository."""
-        return NotificationRepository()
-    
-    def test_get_notification_by_id(self, mock_notification, notification_repository):
+    def fake_manager(self, patch_manager):
+        """Replaces Notification.objects with a manager of plain mocks for the duration of a test (see conftest.py)."""
+        return patch_manager('notifications.models.Notification', 'filter', 'select_related', 'create')
+
+    def test_get_notification_by_id(self, mock_notification, notification_repository, fake_manager):
         """Ensures that the get_notification_by_id method retrieves a notification by ID correctly."""
-        notification_id = 'some-unique-id'
-        with patch.object(Notification.objects, 'get', return_value=mock_notification) as mock_get:
-            notification = notification_repository.get_notification_by_id(notification_id)
-            mock_get.assert_called_once_with(id=notification_id)
-            assert notification == mock_notification
-
-    def test_get_notification_by_id_not_found(self, notification_repository):
-        """Ensures that the get_notification_by_id method handles the case where a notification is not found."""
-        notification_id = 'some-unique-id'
-        with patch.object(Notification.objects, 'get', side_effect=Notification.DoesNotExist):
-            notification = notification_repository.get_notification_by_id(notification_id)
-            assert notification is None
-
-    def test_get_all_notifications(self, mock_notification, notification_repository):
+        notification_id = uuid.uuid4()
+        mock_queryset = fake_manager.select_related.return_value
+        mock_queryset.filter.return_value.first.return_value = mock_notification
+        notification = notification_repository.get_notification_by_id(notification_id)
+        fake_manager.select_related.assert_called_once_with('user', 'appointment')
+        mock_queryset.filter.assert_called_once_with(id=notification_id)
+        assert notification == mock_notification
+
+    def test_get_notification_by_id_malformed(self, notification_repository, fake_manager):
+        """Ensures that a malformed ID is rejected without querying the database."""
+        notification = notification_repository.get_notification_by_id('some-unique-id')
+        fake_manager.select_related.assert_not_called()
+        assert notification is None
+
+    def test_get_all_notifications(self, mock_notification, notification_repository, fake_manager):
         """Ensures that the get_all_notifications method retrieves all notifications correctly."""
         mock_notifications = [mock_notification, mock_notification]
-        with patch.object(Notification.objects, 'all', return_value=mock_notifications) as mock_all:
-            notifications = notification_repository.get_all_notifications()
-            mock_all.assert_called_once()
-            assert notifications == mock_notifications
+        fake_manager.select_related.return_value = mock_notifications
+        notifications = notification_repository.get_all_notifications()
+        fake_manager.select_related.assert_called_once_with('user', 'appointment')
+        assert notifications == mock_notifications
 
-    def test_create_notification(self, mock_notification, notification_repository):
+    def test_create_notification(self, mock_notification, notification_repository, fake_manager):
         """Ensures that the create_notification method handles notification creation correctly."""
         notification_data = {
-            'type': 'sms',
-            'status': 'sent',
-            'message': 'lorem ipsum',
-            'scheduled_send_datetime': '12:34:45 05.06.2024',
-            'priority': 'high',
-            'user': 'The associated user'
-        }
-        with patch.object(Notification.objects, 'create', return_value=mock_notification) as mock_create:
-            notification = notification_repository.create_notification(notification_data)
-            mock_create.assert_called_once_with(**notification_data)
-            assert notification == mock_notification
-
-    def test_create_notification_invalid_data(self, notification_repository):
-        """Ensures that create_notification handles IntegrityError correctly."""
-        notification_data = {
-            'type': 'sms',
-            'status': 'pending',
+            'type': Notification.Type.SMS,
+            'status': Notification.Status.SENT,
             'message': 'lorem ipsum',
             'scheduled_send_datetime': '12:34:45 05.06.2024',
-            'priority': None, # This should trigger an IntegrityError due to not null constraint
+            'priority': Notification.Priority.HIGH,
             'user': 'The associated user'
         }
-        with patch.object(Notification.objects, 'create', side_effect=IntegrityError) as mock_create:
-            notification = notification_repository.create_notification(notification_data)
-            mock_create.assert_called_once_with(**notification_data)
-            assert not notification
-
-    def test_update_notification(self, mock_notification, notification_repository):
-        """Ensures update_notification updates the notification and saves it."""
-        notification_id = 'some-unique-id'
-        notification_data = {
-            'status': 'new status, ie: sent'
-        }
-        assert mock_notification.status != notification_data["status"]
-        with patch.object(Notification.objects, 'get', return_value=mock_notification):
-            updated_notification = notification_repository.update_notification(notification_id, notification_data)
-            for key, value in notification_data.items():
-                setattr(mock_notification, key, value)
-            mock_notification.save.assert_called_once()
-            assert updated_notification == mock_notification
-            assert updated_notification.status == notification_data["status"]
-
-    def test_update_notification_with_invalid_data(self, notification_repository):
-        """Ensures that update_notification handles IntegrityError correctly."""
-        notification_id = 'some-unique-id'
-        invalid_notification_data = {
-            'type': 'invalid-type',  # Assume this is an invalid type format
-        }
-        with patch.object(Notification.objects, 'get', side_effect=IntegrityError):
-            notification = notification_repository.update_notification(notification_id, invalid_notification_data)
-            assert not notification
-
-    def test_update_notification_not_found(self, notification_repository):
-        """Ensures that the update_notification method handles the case where a notification to be updated is not found."""
-        notification_id = 'non-existent-id'
+        fake_manager.create.return_value = mock_notification
+        notification = notification_repository.create_notification(notification_data)
+        fake_manager.create.assert_called_once_with(**notification_data)
+        assert notification == mock_notification
+
+    def test_update_notification(self, mock_notification, notification_repository, fake_manager):
+        """Ensures update_notification updates the notification with a single UPDATE query and stamps updated_at."""
+        notification_id = uuid.uuid4()
         notification_data = {
-            'scheduled_send_datetime': '16:28:40 05.07.2024'
+            'status': Notification.Status.SENT
         }
-        with patch.object(Notification.objects, 'get', side_effect=Notification.DoesNotExist):
-            updated_notification = notification_repository.update_notification(notification_id, notification_data)
-            assert updated_notification is None
-
-    def test_delete_notification(self, mock_notification, notification_repository):
-        """Ensures that the delete_notification method deletes a notification by ID correctly."""
-        notification_id = 'some-unique-id'
-        with patch.object(Notification.objects, 'get', return_value=mock_notification):
-            result = notification_repository.delete_notification(notification_id)
-            mock_notification.delete.assert_called_once()
-            assert result is True
-
-    def test_delete_notification_not_found(self, notification_repository):
-        """Ensures that the delete_notification method handles the case where a notification to be deleted is not found."""
-        notification_id = 'non-existent-id'
-        with patch.object(Notification.objects, 'get', side_effect=Notification.DoesNotExist):
-            result = notification_repository.delete_notification(notification_id)
-            assert result is False
+        mock_queryset = fake_manager.filter.return_value
+        mock_queryset.update.return_value = 1
+        fake_manager.select_related.return_value.get.return_value = mock_notification
+        updated_notification = notification_repository.update_notification(notification_id, notification_data)
+        fake_manager.filter.assert_called_once_with(id=notification_id)
+        update_kwargs = mock_queryset.update.call_args.kwargs
+        assert update_kwargs['status'] == notification_data['status']
+        assert 'updated_at' in update_kwargs
+        fake_manager.select_related.return_value.get.assert_called_once_with(id=notification_id)
+        assert updated_notification == mock_notification
+
+    def test_delete_notification(self, notification_repository, fake_manager):
+        """Ensures that the delete_notification method deletes a notification by ID with a single DELETE query."""
+        notification_id = uuid.uuid4()
+        mock_queryset = fake_manager.filter.return_value
+        mock_queryset.delete.return_value = (1, {'notifications.Notification': 1})
+        result = notification_repository.delete_notification(notification_id)
+        fake_manager.filter.assert_called_once_with(id=notification_id)
+        mock_queryset.delete.assert_called_once()
+        assert result is True
+
+    @pytest.mark.parametrize(
+            'method_name,args,expected',
+            [
+                ('get_notification_by_id', (uuid.uuid4(),), None),
+                ('update_notification', (uuid.uuid4(), {'status': Notification.Status.SENT}), None),
+                ('delete_notification', (uuid.uuid4(),), False),
+            ]
+    )
+    def test_notification_not_found(self, notification_repository, fake_manager, method_name, args, expected):
+        """Ensures that each method handles the case where the notification is not found."""
+        fake_manager.select_related.return_value.filter.return_value.first.return_value = None
+        fake_manager.filter.return_value.update.return_value = 0
+        fake_manager.filter.return_value.delete.return_value = (0, {})
+        result = getattr(notification_repository, method_name)(*args)
+        assert result is expected
+
+    @pytest.mark.parametrize(
+            'method_name,args',
+            [
+                # A missing priority should trigger an IntegrityError due to not null constraint
+                ('create_notification', ({'type': Notification.Type.SMS, 'message': 'lorem ipsum', 'priority': None},)),
+                # Assume this is an invalid type format
+                ('update_notification', (uuid.uuid4(), {'type': 'invalid-type'})),
+            ]
+    )
+    def test_notification_invalid_data(self, notification_repository, fake_manager, method_name, args):
+        """Ensures that each method writing notifications handles IntegrityError correctly."""
+        fake_manager.create.side_effect = IntegrityError
+        fake_manager.filter.return_value.update.side_effect = IntegrityError
+        result = getattr(notification_repository, method_name)(*args)
+        assert result is None
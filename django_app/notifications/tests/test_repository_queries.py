@@ -0,0 +1,334 @@
+import pytest
+import uuid
+
+from asgiref.sync import async_to_sync
+from datetime import timedelta
+from django.utils import timezone
+
+from appointments.models import Appointment
+from notifications.models import Notification
+from notifications.repositories.notification_repository import NOTIFICATION_SUMMARY_FIELDS
+from services.models import Service
+from users.models import CustomUser
+
+
+@pytest.mark.django_db
+class TestNotificationRepositoryQueries:
+    """
+    Test suite for the number of queries issued by the NotificationRepository class.
+
+    Unlike TestNotificationRepository, these tests run against the database so that the queries Django actually
+    issues can be counted, guarding against N+1 regressions when related entities are accessed.
+    """
+    _NOW = timezone.now()
+    created_at = _NOW
+    updated_at = _NOW
+    starts_at = _NOW + timedelta(days=1)
+    ends_at = _NOW + timedelta(days=1, hours=1)
+    scheduled_send_datetime = _NOW
+
+    def create_notifications(self, count):
+        """Creates `count` notifications, each with its own user and appointment, with one INSERT per model."""
+        users = CustomUser.objects.bulk_create([
+            CustomUser(
+                created_at=self.created_at,
+                updated_at=self.updated_at,
+                username=f'test_username_{i}',
+                email=f'test_email_{i}',
+                password='test_password'
+            )
+            for i in range(count)
+        ])
+        services = Service.objects.bulk_create([
+            Service(
+                created_at=self.created_at,
+                updated_at=self.updated_at,
+                name=f'Test Service Name {i}',
+                description='Test Service Description',
+                duration=60,
+                price=50
+            )
+            for i in range(count)
+        ])
+        appointments = Appointment.objects.bulk_create([
+            Appointment(
+                created_at=self.created_at,
+                updated_at=self.updated_at,
+                starts_at=self.starts_at,
+                ends_at=self.ends_at,
+                status='scheduled',
+                user=user,
+                service=service,
+            )
+            for user, service in zip(users, services)
+        ])
+        Notification.objects.bulk_create([
+            Notification(
+                type=Notification.Type.EMAIL,
+                status=Notification.Status.PENDING,
+                message='test message',
+                scheduled_send_datetime=self.scheduled_send_datetime,
+                priority=Notification.Priority.LOW,
+                user=user,
+                appointment=appointment,
+            )
+            for user, appointment in zip(users, appointments)
+        ])
+
+    def test_get_all_notifications_single_query(self, notification_repository, django_assert_num_queries):
+        """Ensures that accessing the user and appointment of every notification does not issue a query per notification."""
+        self.create_notifications(3)
+
+        with django_assert_num_queries(1):
+            for notification in notification_repository.get_all_notifications():
+                assert notification.user.username
+                assert notification.appointment.status
+
+    def test_get_notification_by_id_single_query(self, notification_repository, django_assert_num_queries):
+        """Ensures that a notification is retrieved together with its user and appointment."""
+        self.create_notifications(1)
+        notification_id = Notification.objects.get().id
+
+        with django_assert_num_queries(1):
+            notification = notification_repository.get_notification_by_id(notification_id)
+            assert notification.user.username
+            assert notification.appointment.status
+
+    def test_list_notifications_pages(self, notification_repository, django_assert_num_queries):
+        """
+        Ensures that walking the pages returns every notification exactly once, newest first, with one query per page.
+
+        All notifications share a created_at timestamp so that the id tie-breaker is exercised.
+        """
+        self.create_notifications(5)
+        Notification.objects.update(created_at=self.created_at)
+        expected_ids = list(Notification.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+
+        listed_ids, page_sizes, cursor = [], [], None
+        while True:
+            with django_assert_num_queries(1):
+                notifications, cursor = notification_repository.list_notifications(after=cursor, limit=2)
+            listed_ids += [notification.id for notification in notifications]
+            page_sizes.append(len(notifications))
+            if cursor is None:
+                break
+
+        assert page_sizes == [2, 2, 1]
+        assert listed_ids == expected_ids
+
+    def test_list_notifications_for_user(self, notification_repository):
+        """Ensures that listing notifications for a user only returns that user's notifications."""
+        self.create_notifications(3)
+        user = CustomUser.objects.get(username='test_username_1')
+
+        notifications, cursor = notification_repository.list_notifications(user_id=user.id)
+
+        assert [notification.user for notification in notifications] == [user]
+        assert cursor is None
+
+    def test_bulk_create_notifications_single_insert(self, notification_repository, django_assert_num_queries):
+        """Ensures that bulk creating notifications inserts them all with one query, inside a savepoint."""
+        self.create_notifications(1)
+        notification = Notification.objects.get()
+        notifications_data = [
+            {
+                'type': Notification.Type.SMS,
+                'message': f'bulk message {i}',
+                'scheduled_send_datetime': self.scheduled_send_datetime + timedelta(hours=i),
+                'priority': Notification.Priority.HIGH,
+                'user': notification.user,
+                'appointment': notification.appointment,
+            }
+            for i in range(3)
+        ]
+
+        # The savepoint and its release account for the other two queries.
+        with django_assert_num_queries(3):
+            notifications = notification_repository.bulk_create_notifications(notifications_data)
+
+        assert len(notifications) == 3
+        assert Notification.objects.filter(type=Notification.Type.SMS).count() == 3
+
+    def test_bulk_create_notifications_invalid_data(self, notification_repository):
+        """Ensures that an IntegrityError rolls back the whole batch rather than inserting part of it."""
+        self.create_notifications(1)
+        notification = Notification.objects.get()
+        notifications_data = [
+            {
+                'type': notification_type,
+                'message': 'test message',
+                'scheduled_send_datetime': self.scheduled_send_datetime + timedelta(hours=1),
+                'priority': Notification.Priority.LOW,
+                'user': notification.user,
+            }
+            for notification_type in (Notification.Type.SMS, 3)  # 3 should trigger an IntegrityError due to notif_type_valid
+        ]
+
+        assert notification_repository.bulk_create_notifications(notifications_data) is None
+        assert Notification.objects.count() == 1
+
+    def test_bulk_create_notifications_skips_duplicates(self, notification_repository):
+        """Ensures that reminders already enqueued for an appointment are skipped rather than raising or being saved twice."""
+        self.create_notifications(1)
+        notification = Notification.objects.get()
+        notifications_data = [
+            {
+                'type': notification.type,
+                'message': 'test message',
+                'scheduled_send_datetime': scheduled_send_datetime,
+                'priority': Notification.Priority.LOW,
+                'user': notification.user,
+                'appointment': notification.appointment,
+            }
+            for scheduled_send_datetime in (
+                notification.scheduled_send_datetime,
+                self.scheduled_send_datetime + timedelta(hours=1),
+                self.scheduled_send_datetime + timedelta(hours=1),
+            )
+        ]
+
+        notification_repository.bulk_create_notifications(notifications_data)
+
+        assert Notification.objects.count() == 2
+
+    def test_bulk_update_status_single_query(self, notification_repository, django_assert_num_queries):
+        """Ensures that the status of many notifications is updated with one query."""
+        self.create_notifications(3)
+        notification_ids = list(Notification.objects.values_list('id', flat=True))
+        actual_sent_datetime = timezone.now()
+
+        with django_assert_num_queries(1):
+            updated_count = notification_repository.bulk_update_status(
+                notification_ids, Notification.Status.SENT, actual_sent_datetime
+            )
+
+        assert updated_count == 3
+        assert set(Notification.objects.values_list('status', flat=True)) == {Notification.Status.SENT}
+        assert set(Notification.objects.values_list('actual_sent_datetime', flat=True)) == {actual_sent_datetime}
+
+    def test_update_notification_single_update(self, notification_repository, django_assert_num_queries):
+        """Ensures that an update issues one UPDATE, touching only the given columns and updated_at, before re-reading."""
+        self.create_notifications(1)
+        notification = Notification.objects.get()
+
+        # One UPDATE, wrapped in a savepoint, then the re-read.
+        with django_assert_num_queries(4) as captured:
+            updated_notification = notification_repository.update_notification(
+                notification.id, {'status': Notification.Status.SENT}
+            )
+
+        update_sql = captured.captured_queries[1]['sql']
+        assert update_sql.startswith('UPDATE')
+        assert '"message"' not in update_sql
+        assert updated_notification.status == Notification.Status.SENT
+        assert updated_notification.updated_at > notification.updated_at
+
+    def test_update_notification_conflict_keeps_transaction_usable(self, notification_repository):
+        """Ensures that a failed update is rolled back to its savepoint, leaving the surrounding transaction usable."""
+        self.create_notifications(1)
+        notification_id = Notification.objects.get().id
+
+        # An unknown type violates the notif_type_valid check constraint.
+        assert notification_repository.update_notification(notification_id, {'type': 99}) is None
+
+        assert Notification.objects.get().type == Notification.Type.EMAIL
+
+    def test_update_notification_malformed_id(self, notification_repository, django_assert_num_queries):
+        """Ensures that updating a malformed ID returns None without querying the database."""
+        with django_assert_num_queries(0):
+            assert notification_repository.update_notification('bad', {'status': Notification.Status.SENT}) is None
+
+    def test_list_summaries_single_query(self, notification_repository, django_assert_num_queries):
+        """Ensures that summaries are listed with their user in one query, leaving the wide columns unloaded."""
+        self.create_notifications(3)
+
+        with django_assert_num_queries(1):
+            notifications = list(notification_repository.list_summaries(status=Notification.Status.PENDING))
+            for notification in notifications:
+                assert notification.user.username
+                assert notification.status == Notification.Status.PENDING
+
+        assert len(notifications) == 3
+        assert {'channel_specific_info', 'message'} <= notifications[0].get_deferred_fields()
+
+    def test_claim_due_batch_single_query(self, notification_repository, django_assert_num_queries):
+        """Ensures that due, pending notifications are claimed in one query, oldest first, up to the limit."""
+        self.create_notifications(4)
+        notifications = list(Notification.objects.order_by('user__username'))
+        for hours, notification in zip((-3, -1, -2, 1), notifications):
+            notification.scheduled_send_datetime = self.scheduled_send_datetime + timedelta(hours=hours)
+        Notification.objects.bulk_update(notifications, ['scheduled_send_datetime'])
+
+        with django_assert_num_queries(1):
+            claimed = notification_repository.claim_due_batch(self.scheduled_send_datetime, limit=2)
+
+        assert sorted(notification.id for notification in claimed) == sorted([notifications[0].id, notifications[2].id])
+        assert {notification.status for notification in claimed} == {Notification.Status.SENDING}
+        assert Notification.objects.filter(status=Notification.Status.PENDING).count() == 2
+
+    def test_claim_due_batch_skips_claimed(self, notification_repository):
+        """Ensures that notifications already claimed, or not yet due, are not claimed again."""
+        self.create_notifications(2)
+        Notification.objects.filter(user__username='test_username_1').update(
+            scheduled_send_datetime=self.scheduled_send_datetime + timedelta(hours=1)
+        )
+
+        first_claim = notification_repository.claim_due_batch(self.scheduled_send_datetime)
+        second_claim = notification_repository.claim_due_batch(self.scheduled_send_datetime)
+
+        assert [notification.user.username for notification in first_claim] == ['test_username_0']
+        assert second_claim == []
+
+    def test_list_summary_values(self, notification_repository, django_assert_num_queries):
+        """Ensures that summary values are listed with one query, holding only the summary fields."""
+        self.create_notifications(2)
+
+        with django_assert_num_queries(1):
+            summaries = list(notification_repository.list_summary_values(status=Notification.Status.PENDING))
+
+        assert len(summaries) == 2
+        assert set(summaries[0]) == set(NOTIFICATION_SUMMARY_FIELDS)
+
+    def test_delete_notification_single_query(self, notification_repository, django_assert_num_queries):
+        """Ensures that a notification is deleted with one DELETE, without first being read."""
+        self.create_notifications(1)
+        notification_id = Notification.objects.get().id
+
+        with django_assert_num_queries(1):
+            assert notification_repository.delete_notification(notification_id) is True
+
+    def test_delete_notification_malformed_id(self, notification_repository, django_assert_num_queries):
+        """Ensures that deleting a malformed ID returns False without querying the database."""
+        with django_assert_num_queries(0):
+            assert notification_repository.delete_notification('bad') is False
+
+    def test_aget_notification_by_id_single_query(self, notification_repository, django_assert_num_queries):
+        """Ensures that the async read retrieves a notification with its user and appointment in one query."""
+        self.create_notifications(1)
+        notification_id = Notification.objects.get().id
+
+        with django_assert_num_queries(1):
+            notification = async_to_sync(notification_repository.aget_notification_by_id)(notification_id)
+            assert notification.user.username
+            assert notification.appointment.status
+
+    def test_aget_notification_by_id_not_found(self, notification_repository):
+        """Ensures that the async read returns None for missing and malformed IDs."""
+
+        assert async_to_sync(notification_repository.aget_notification_by_id)(uuid.uuid4()) is None
+        assert async_to_sync(notification_repository.aget_notification_by_id)('some-unique-id') is None
+
+    def test_aget_all_notifications_single_query(self, notification_repository, django_assert_num_queries):
+        """Ensures that iterating all notifications asynchronously does not issue a query per notification."""
+        self.create_notifications(3)
+
+        async def collect():
+            return [
+                (notification.user.username, notification.appointment.status)
+                async for notification in notification_repository.aget_all_notifications()
+            ]
+
+        with django_assert_num_queries(1):
+            notifications = async_to_sync(collect)()
+
+        assert len(notifications) == 3
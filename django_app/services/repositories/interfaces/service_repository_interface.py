@@ -3,21 +3,41 @@ from abc import ABC, abstractmethod
 
 class ServiceRepositoryInterface(ABC):
     @abstractmethod
-    def get_service_by_id(self, service_id):
+    def get_service_by_id(self, service_id, prefetch_related=()):
         pass
 
     @abstractmethod
-    def get_all_services(self):
+    def get_services_by_ids(self, service_ids):
+        pass
+
+    @abstractmethod
+    def get_all_services(self, prefetch_related=()):
+        pass
+
+    @abstractmethod
+    def iter_all_services(self, chunk_size=2000):
+        pass
+
+    @abstractmethod
+    def list_services_summary(self):
         pass
 
     @abstractmethod
     def create_service(self, service_data):
         pass
 
+    @abstractmethod
+    def bulk_create_services(self, services_data, batch_size=500):
+        pass
+
     @abstractmethod
     def update_service(self, service_id, service_data):
         pass
 
+    @abstractmethod
+    def fast_update_service(self, service_id, service_data):
+        pass
+
     @abstractmethod
     def delete_service(self, service_id):
         pass
@@ -1,17 +1,44 @@
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
+from django.db.models.query_utils import DeferredAttribute
+from common.ids import is_valid_uuid
 from services.models import Service
 from services.repositories.interfaces.service_repository_interface import ServiceRepositoryInterface
 
+# The columns list views need, leaving out the description and image.
+SERVICE_SUMMARY_FIELDS = ('id', 'name', 'price', 'duration', 'availability')
+
+# Fields accessed through a plain DeferredAttribute, which has no setter, so their values can be written to the
+# instance __dict__ directly. Other fields, such as the image, must be set through their descriptor.
+_PLAIN_FIELDS = frozenset(
+    field.attname for field in Service._meta.concrete_fields
+    if type(Service.__dict__.get(field.attname)) is DeferredAttribute
+)
+
 
 class ServiceRepository(ServiceRepositoryInterface):
-    def get_service_by_id(self, service_id):
-        try:
-            return Service.objects.get(id=service_id)
-        except:
+    def get_service_by_id(self, service_id, prefetch_related=()):
+        if not is_valid_uuid(service_id):
             return None
+        # Service has no foreign keys of its own, so related objects, such as appointments, are prefetched rather than joined.
+        services = Service.objects.prefetch_related(*prefetch_related) if prefetch_related else Service.objects
+        return services.filter(id=service_id).first()
     
-    def get_all_services(self):
-        return Service.objects.all()
+    def get_services_by_ids(self, service_ids):
+        # Malformed IDs cannot match a service, and would make in_bulk raise, so they are dropped beforehand.
+        return Service.objects.in_bulk([service_id for service_id in service_ids if is_valid_uuid(service_id)])
+
+    def get_all_services(self, prefetch_related=()):
+        services = Service.objects.all()
+        if prefetch_related:
+            services = services.prefetch_related(*prefetch_related)
+        return services
+
+    def iter_all_services(self, chunk_size=2000):
+        return Service.objects.iterator(chunk_size=chunk_size)
+
+    def list_services_summary(self):
+        # Accessing a deferred field, such as description, on a returned service issues a query per service.
+        return Service.objects.only(*SERVICE_SUMMARY_FIELDS)
     
     def create_service(self, service_data):
         try:
@@ -19,23 +46,42 @@ class ServiceRepository(ServiceRepositoryInterface):
         except IntegrityError:
             return None
 
+    def bulk_create_services(self, services_data, batch_size=500):
+        try:
+            with transaction.atomic():
+                return Service.objects.bulk_create(
+                    [Service(**service_data) for service_data in services_data],
+                    batch_size=batch_size,
+                )
+        except IntegrityError:
+            return None
+
     
     def update_service(self, service_id, service_data):
+        if not is_valid_uuid(service_id):
+            return None
         try:
             service = Service.objects.get(id=service_id)
+            vars(service).update({key: value for key, value in service_data.items() if key in _PLAIN_FIELDS})
             for key, value in service_data.items():
-                setattr(service, key, value)
+                if key not in _PLAIN_FIELDS:
+                    setattr(service, key, value)
             service.save()
             return service
         except Service.DoesNotExist:
             return None
-        except IntegrityError:
-            return None
+
+    def fast_update_service(self, service_id, service_data):
+        if not is_valid_uuid(service_id):
+            return 0
+        # An IntegrityError is left for ServiceService to report, so that it is not taken for a missing service.
+        return Service.objects.filter(id=service_id).update(**service_data)
     
     def delete_service(self, service_id):
-        try:
-            service = Service.objects.get(id=service_id)
-            service.delete()
-            return True
-        except Service.DoesNotExist:
+        if not is_valid_uuid(service_id):
             return False
+        deleted_count, _ = Service.objects.filter(id=service_id).delete()
+        return deleted_count > 0
+
+
+service_repository = ServiceRepository()
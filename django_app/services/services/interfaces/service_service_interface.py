@@ -7,13 +7,21 @@ class ServiceServiceInterface(ABC):
         pass
 
     @abstractmethod
-    def get_all_services(self):
+    def get_services(self, service_ids):
+        pass
+
+    @abstractmethod
+    def get_all_services(self, summary=False):
         pass
 
     @abstractmethod
     def create_service(self, service_data):
         pass
 
+    @abstractmethod
+    def create_services(self, services_data):
+        pass
+
     @abstractmethod
     def update_service(self, service_id, service_data):
         pass
@@ -1,8 +1,7 @@
-from datetime import datetime
 from django.core.exceptions import ValidationError
-from django.utils.timezone import make_aware as make_aware_of_timezone
+from django.utils import timezone
 
-from services.repositories.service_repository import ServiceRepository
+from services.repositories.service_repository import service_repository
 from services.services.interfaces.service_service_interface import ServiceServiceInterface
 from services.services.validators.service_service_validator import ServiceServiceValidator
 
@@ -13,14 +12,16 @@ class ServiceService(ServiceServiceInterface):
 
     Methods:
         get_service(service_id)
-        get_all_services()
+        get_services(service_ids)
+        get_all_services(summary=False)
         create_service(service_data)
+        create_services(services_data)
         update_service(service_id, service_data)
         delete_service(service_id)
     """
 
     def __init__(self):
-        self.service_repository = ServiceRepository()
+        self.service_repository = service_repository
         self.validator = ServiceServiceValidator()
 
     def get_service(self, service_id):
@@ -29,36 +30,91 @@ class ServiceService(ServiceServiceInterface):
         self.validator.validate_service_exists(service, service_id)
         return service
     
-    def get_all_services(self):
-        """Retrieves all services."""
+    def get_services(self, service_ids):
+        """Retrieves the services with the given IDs in a single query, as a dict keyed by ID."""
+        return self.service_repository.get_services_by_ids(service_ids)
+
+    def get_all_services(self, summary=False):
+        """Retrieves all services, with only the fields list views need when `summary` is set."""
+        if summary:
+            return self.service_repository.list_services_summary()
         services = self.service_repository.get_all_services()
         return services
     
     def create_service(self, service_data):
         """Validates and creates a new service."""
-        service_data['created_at'] = make_aware_of_timezone(datetime.now())
-        service_data['updated_at'] = make_aware_of_timezone(datetime.now())
+        # Service has no auto_now fields, so both timestamps are set here, from a single clock read so they match.
+        now = timezone.now()
+        service_data['created_at'] = now
+        service_data['updated_at'] = now
         self.validator.validate_service_data(service_data)
         try:
             return self.service_repository.create_service(service_data)
         except Exception as e:
             raise ValidationError(f"Error creating service: {e}")
     
+    def create_services(self, services_data):
+        """Validates and creates several services, as for a bulk import, reporting the errors in every service at once."""
+        now = timezone.now()
+        for service_data in services_data:
+            service_data['created_at'] = now
+            service_data['updated_at'] = now
+        self.validator.validate_many(services_data)
+        try:
+            return self.service_repository.bulk_create_services(services_data)
+        except Exception as e:
+            raise ValidationError(f"Error creating services: {e}")
+
     def update_service(self, service_id, service_data):
         """Validates and updates an existing service."""
-        # Ensure service instance exists
-        service = self.service_repository.get_service_by_id(service_id)
-        self.validator.validate_service_exists(service, service_id)
+        if 'image' not in service_data:
+            return self._fast_update_service(service_id, service_data)
         # Set updated_at timestamp and validate data before updating.
-        service_data['updated_at'] = make_aware_of_timezone(datetime.now())
-        self.validator.validate_service_data(service_data, is_update=True)
+        service_data['updated_at'] = timezone.now()
+        self._validate_update_data(service_id, service_data)
+        try:
+            service = self.service_repository.update_service(service_id, service_data)
+        except Exception as e:
+            raise ValidationError(f"Error updating service: {e}")
+        # update_service retrieves the service itself, and returns None when there is none, so it is not looked up first.
+        self.validator.validate_service_exists(service, service_id)
+        return service
+
+    def _fast_update_service(self, service_id, service_data):
+        """
+        Validates and updates an existing service with a single UPDATE, re-reading it only if it was updated.
+
+        Not used for image uploads, as the image file is only stored when the service is saved.
+        """
+        service_data['updated_at'] = timezone.now()
+        self._validate_update_data(service_id, service_data)
         try:
-            return self.service_repository.update_service(service_id, service_data)
+            updated_count = self.service_repository.fast_update_service(service_id, service_data)
         except Exception as e:
             raise ValidationError(f"Error updating service: {e}")
+        service = self.service_repository.get_service_by_id(service_id) if updated_count else None
+        self.validator.validate_service_exists(service, service_id)
+        return service
     
+    def _validate_update_data(self, service_id, service_data):
+        """
+        Validates the data for updating a service, reporting a missing service rather than the errors in its data.
+
+        The service is only looked up when the data is invalid, so a valid update is not preceded by a SELECT.
+        """
+        try:
+            self.validator.validate_service_data(service_data, is_update=True)
+        except ValidationError:
+            self.validator.validate_service_exists(self.service_repository.get_service_by_id(service_id), service_id)
+            raise
+
     def delete_service(self, service_id):
         """Deletes a service by its ID."""
-        service = self.service_repository.get_service_by_id(service_id)
-        self.validator.validate_service_exists(service, service_id)
-        return self.service_repository.delete_service(service_id)
+        # The row count of the DELETE tells whether the service existed, so it is not looked up first.
+        deleted = self.service_repository.delete_service(service_id)
+        if not deleted:
+            self.validator.validate_service_exists(None, service_id)
+        return deleted
+
+
+service_service = ServiceService()
@@ -1,8 +1,32 @@
-import re
-
 from datetime import datetime
+from decimal import Decimal, InvalidOperation
 from django.core.exceptions import ValidationError
 
+# Prices have at most 3 digits before the decimal point and 2 after it.
+_MAX_PRICE = Decimal(1000)
+_MIN_PRICE_EXPONENT = -2
+_PRICE_INVALID_FORMAT = "Service price must have a maximum of 5 digits with up to 2 decimal places."
+
+# Bounds for the service fields, with their error messages formatted once at import rather than on each raise.
+_MIN_NAME_LENGTH = 3
+_MAX_NAME_LENGTH = 150
+_NAME_TOO_SHORT = f"Service name must be at least {_MIN_NAME_LENGTH} characters long."
+_NAME_TOO_LONG = f"Service name must be no greater than {_MAX_NAME_LENGTH} characters long."
+
+_MIN_DESCRIPTION_LENGTH = 10
+_MAX_DESCRIPTION_LENGTH = 2000
+_DESCRIPTION_TOO_SHORT = f"Service description must be at least {_MIN_DESCRIPTION_LENGTH} characters long."
+_DESCRIPTION_TOO_LONG = f"Service description must be no greater than {_MAX_DESCRIPTION_LENGTH} characters long."
+
+_MIN_DURATION = 10
+_MAX_DURATION = 480
+_DURATION_TOO_SHORT = f"Service duration must be at least {_MIN_DURATION} minutes."
+_DURATION_TOO_LONG = f"Service duration must be no greater than {_MAX_DURATION} minutes."
+
+# The fields validate_service_data requires, checked together before any is validated. Timestamps are left out, as
+# ServiceService stamps them itself.
+_REQUIRED_FIELDS = frozenset({'name', 'description', 'duration', 'price'})
+
 
 class ServiceServiceValidator:
     """
@@ -20,6 +44,26 @@ class ServiceServiceValidator:
         validate_created_at(created_at)
         validate_updated_at(updated_at)
     """
+    # The messages raised for each timestamp, built once rather than formatted on every validation.
+    _AWARE_DATETIME_MESSAGES = {
+        field_name: (
+            f"{field_name} is required.",
+            f"{field_name} must be a datetime object.",
+            f"{field_name} must be an aware datetime object with timezone information.",
+        )
+        for field_name in ('created_at', 'updated_at')
+    }
+
+    def __init__(self):
+        # The validators for the fields every service data must hold, in the order they are checked.
+        # They are static, so no bound method is created when they are called.
+        self._field_validators = {
+            'name': self.validate_name,
+            'description': self.validate_description,
+            'duration': self.validate_duration,
+            'price': self.validate_price,
+        }
+
     def validate_service_exists(self, service, service_id):
         if not service:
             raise ValidationError(f"Service with ID {service_id} does not exist.")
@@ -30,18 +74,49 @@ class ServiceServiceValidator:
         
         This contains any business logic validation (e.g., string length, value ranges, format checks).
         Any database level constraints (e.g., unique constraints, field types, nullability) should be defined on the model.
+
+        Timestamps are stamped by ServiceService rather than supplied by callers, so they are only validated when present;
+        a missing timestamp is still rejected by its non-null column.
+        """
+        if is_update and 'id' in service_data:
+            raise ValidationError("ID cannot be modified.")
+        missing_fields = _REQUIRED_FIELDS.difference(service_data)
+        if missing_fields:
+            raise ValidationError(f"Missing fields: {', '.join(sorted(missing_fields))}.")
+        if not is_update and 'created_at' in service_data:
+            self._validate_aware_datetime(service_data['created_at'], 'created_at')
+        if 'updated_at' in service_data:
+            self._validate_aware_datetime(service_data['updated_at'], 'updated_at')
+        for field_name, validate in self._field_validators.items():
+            validate(service_data[field_name])
+
+    def validate_many(self, services_data, is_update=False):
         """
+        Validates several service data at once, as for a bulk import, raising every error found rather than the first.
+
+        Each field is validated down the whole list in turn, rather than each service data in turn. The errors are
+        raised as one ValidationError, keyed by the index of the service data they were found in. As with
+        validate_service_data, timestamps are only validated when present.
+        """
+        errors = {}
         if is_update:
-            if 'id' in service_data:
-                raise ValidationError("ID cannot be modified.")
-            self.validate_updated_at(service_data.get('updated_at', None))
+            for index, service_data in enumerate(services_data):
+                if 'id' in service_data:
+                    errors.setdefault(index, []).append(ValidationError("ID cannot be modified."))
+            validators = {'updated_at': self.validate_updated_at}
         else:
-            self.validate_created_at(service_data.get('created_at', None))
-            self.validate_updated_at(service_data.get('updated_at', None))
-        self.validate_name(service_data['name'])
-        self.validate_description(service_data['description'])
-        self.validate_duration(service_data['duration'])
-        self.validate_price(service_data['price'])
+            validators = {'created_at': self.validate_created_at, 'updated_at': self.validate_updated_at}
+        validators.update(self._field_validators)
+        for field_name, validate in validators.items():
+            for index, service_data in enumerate(services_data):
+                if field_name in self._AWARE_DATETIME_MESSAGES and field_name not in service_data:
+                    continue
+                try:
+                    validate(service_data.get(field_name))
+                except ValidationError as error:
+                    errors.setdefault(index, []).extend(error.error_list)
+        if errors:
+            raise ValidationError(errors)
 
     def validate_created_at(self, created_at):
         """
@@ -53,12 +128,7 @@ class ServiceServiceValidator:
         Raises:
             ValidationError: If the created_at timestamp is invalid.
         """
-        if created_at is None:
-            raise ValidationError("created_at is required.")
-        if not isinstance(created_at, datetime):
-            raise ValidationError("created_at must be a datetime object.")
-        if created_at.tzinfo is None or created_at.tzinfo.utcoffset(created_at) is None:
-            raise ValidationError("created_at must be an aware datetime object with timezone information.")
+        self._validate_aware_datetime(created_at, 'created_at')
         
     def validate_updated_at(self, updated_at):
         """
@@ -70,54 +140,78 @@ class ServiceServiceValidator:
         Raises:
             ValidationError: If the updated_at timestamp is invalid.
         """
-        if updated_at is None:
-            raise ValidationError("updated_at is required.")
-        if not isinstance(updated_at, datetime):
-            raise ValidationError("updated_at must be a datetime object.")
-        if updated_at.tzinfo is None or updated_at.tzinfo.utcoffset(updated_at) is None:
-            raise ValidationError("updated_at must be an aware datetime object with timezone information.")
-
-    def validate_name(self, name):
+        self._validate_aware_datetime(updated_at, 'updated_at')
+
+    def _validate_aware_datetime(self, value, field_name):
+        """Ensure the timestamp exists and is an aware datetime, raising the messages for `field_name` otherwise."""
+        required_message, type_message, aware_message = self._AWARE_DATETIME_MESSAGES[field_name]
+        if value is None:
+            raise ValidationError(required_message)
+        if not isinstance(value, datetime):
+            raise ValidationError(type_message)
+        # datetime.utcoffset() is None both when there is no tzinfo and when the tzinfo gives no offset.
+        if value.utcoffset() is None:
+            raise ValidationError(aware_message)
+
+    @staticmethod
+    def validate_name(name):
         """Ensure the name exists and meets falls within the required length."""
         if not name:
             raise ValidationError("Service name is required.")
-        min_allowed_length = 3
-        max_allowed_length = 150
-        if len(name) < min_allowed_length:
-            raise ValidationError(f"Service name must be at least {min_allowed_length} characters long.")
-        if len(name) > max_allowed_length:
-            raise ValidationError(f"Service name must be no greater than {max_allowed_length} characters long.")
+        name_length = len(name)
+        if name_length < _MIN_NAME_LENGTH:
+            raise ValidationError(_NAME_TOO_SHORT)
+        if name_length > _MAX_NAME_LENGTH:
+            raise ValidationError(_NAME_TOO_LONG)
         
-    def validate_description(self, description):
+    @staticmethod
+    def validate_description(description):
         """Ensure the description exists, meets falls within the required length."""
         if not description:
             raise ValidationError("Service description is required.")
-        min_allowed_length = 10
-        max_allowed_length = 2000
-        if len(description) < min_allowed_length:
-            raise ValidationError(f"Service description must be at least {min_allowed_length} characters long.")
-        if len(description) > max_allowed_length:
-            raise ValidationError(f"Service description must be no greater than {max_allowed_length} characters long.")
+        description_length = len(description)
+        if description_length < _MIN_DESCRIPTION_LENGTH:
+            raise ValidationError(_DESCRIPTION_TOO_SHORT)
+        if description_length > _MAX_DESCRIPTION_LENGTH:
+            raise ValidationError(_DESCRIPTION_TOO_LONG)
         
-    def validate_duration(self, duration):
-        """Ensure the duration exists and falls within the min/max times"""
-        if not duration:
+    @staticmethod
+    def validate_duration(duration):
+        """
+        Ensure the duration exists and falls within the min/max times.
+
+        Only None counts as missing, so a duration of 0 is reported as too short rather than as required.
+        """
+        if duration is None:
             raise ValidationError("Service duration is required.")
-        min_allowed_duration = 10
-        max_allowed_duration = 480
-        if duration <= min_allowed_duration:
-                raise ValidationError(f"Service duration must be at least {min_allowed_duration} minutes.")
-        if duration > max_allowed_duration:
-            raise ValidationError(f"Service duration must be no greater than {max_allowed_duration} minutes.")
-
-    def validate_price(self, price):
-        """Ensure the price exists, positive and has the required significant figures."""
-        if not price:
+        # A single chained comparison on the common, in range, path; the bound that failed is only worked out when raising.
+        if not _MIN_DURATION <= duration <= _MAX_DURATION:
+            raise ValidationError(_DURATION_TOO_SHORT if duration < _MIN_DURATION else _DURATION_TOO_LONG)
+
+    @staticmethod
+    def validate_price(price):
+        """
+        Ensure the price exists, positive and has the required significant figures.
+
+        Only None counts as missing, so a price of 0 is reported as not positive rather than as required.
+        """
+        if price is None:
             raise ValidationError("Service price is required.")
+        # Booleans are ints, but not prices.
+        if isinstance(price, bool):
+            raise ValidationError(_PRICE_INVALID_FORMAT)
+        try:
+            # Parsed from its string form, so a float is read as written (50.1) rather than as its binary expansion.
+            price = Decimal(str(price))
+        except InvalidOperation:
+            raise ValidationError(_PRICE_INVALID_FORMAT)
+        # NaN and infinity parse as Decimals, but are not prices.
+        if not price.is_finite():
+            raise ValidationError(_PRICE_INVALID_FORMAT)
         if price <= 0:
             raise ValidationError("Service price must be a positive number.")
-        if not re.match(r'^\d{1,3}(\.\d{1,2})?$', str(price)):
-            raise ValidationError("Service price must have a maximum of 5 digits with up to 2 decimal places.")
+        if price >= _MAX_PRICE or price.as_tuple().exponent < _MIN_PRICE_EXPONENT:
+            raise ValidationError(_PRICE_INVALID_FORMAT)
 
         
 
@@ -1,7 +1,8 @@
 
 import pytest
+import uuid
 
-from django.db import IntegrityError
+from django.db import DatabaseError, IntegrityError
 from unittest.mock import MagicMock, patch
 
 from services.models import Service
@@ -23,14 +24,22 @@ class TestServiceRepository:
     Tests:
         - test_get_service_by_id
         - test_get_service_by_id_not_found
+        - test_get_service_by_id_database_error
+        - test_get_services_by_ids
+        - test_get_services_by_ids_malformed
         - test_get_all_services
+        - test_iter_all_services
+        - test_list_services_summary
         - test_create_service
         - test_create_service_invalid_data
         - test_update_service
         - test_update_service_with_invalid_data
         - test_update_service_not_found
+        - test_fast_update_service
+        - test_fast_update_service_with_invalid_data
         - test_delete_service
         - test_delete_service_not_found
+        - test_service_id_malformed
 
     The tests utilize unittest.mock to patch Django ORM methods, allowing for the simulation of database interactions without
     requiring an actual database. This approach provides faster and more reliable tests by isolating the repository logic
@@ -51,19 +60,62 @@ class TestServiceRepository:
     
     def test_get_service_by_id(self, mock_service, service_repository):
         """Ensures that the get_service_by_id method retrieves a service by ID correctly."""
-        service_id = 'some-unique-id'
-        with patch.object(Service.objects, 'get', return_value=mock_service) as mock_get:
+        service_id = uuid.uuid4()
+        with patch.object(Service.objects, 'filter') as mock_filter:
+            mock_filter.return_value.first.return_value = mock_service
             service = service_repository.get_service_by_id(service_id)
-            mock_get.assert_called_once_with(id=service_id)
+            mock_filter.assert_called_once_with(id=service_id)
             assert service == mock_service
 
     def test_get_service_by_id_not_found(self, service_repository):
         """Ensures that the get_service_by_id method handles the case where a service is not found."""
-        service_id = 'some-unique-id'
-        with patch.object(Service.objects, 'get', side_effect=Service.DoesNotExist):
+        service_id = uuid.uuid4()
+        with patch.object(Service.objects, 'filter') as mock_filter:
+            mock_filter.return_value.first.return_value = None
             service = service_repository.get_service_by_id(service_id)
             assert service is None
 
+    @pytest.mark.parametrize(
+            'method_name,args,expected',
+            [
+                ('get_service_by_id', ('some-unique-id',), None),
+                ('update_service', ('some-unique-id', {'price': 35}), None),
+                ('fast_update_service', ('some-unique-id', {'price': 35}), 0),
+                ('delete_service', ('some-unique-id',), False),
+            ]
+    )
+    def test_service_id_malformed(self, service_repository, method_name, args, expected):
+        """Ensures that each method rejects an ID that is not a valid UUID without querying the database."""
+        with patch.object(Service.objects, 'filter') as mock_filter, patch.object(Service.objects, 'get') as mock_get:
+            result = getattr(service_repository, method_name)(*args)
+            mock_filter.assert_not_called()
+            mock_get.assert_not_called()
+            assert result == expected
+
+    def test_get_service_by_id_database_error(self, service_repository):
+        """Ensures that the get_service_by_id method lets database errors propagate rather than reporting a missing service."""
+        service_id = uuid.uuid4()
+        with patch.object(Service.objects, 'filter') as mock_filter:
+            mock_filter.return_value.first.side_effect = DatabaseError
+            with pytest.raises(DatabaseError):
+                service_repository.get_service_by_id(service_id)
+
+    def test_get_services_by_ids(self, mock_service, service_repository):
+        """Ensures that the get_services_by_ids method retrieves several services with a single in_bulk lookup."""
+        service_ids = [uuid.uuid4(), uuid.uuid4()]
+        mock_services = {service_id: mock_service for service_id in service_ids}
+        with patch.object(Service.objects, 'in_bulk', return_value=mock_services) as mock_in_bulk:
+            services = service_repository.get_services_by_ids(service_ids)
+            mock_in_bulk.assert_called_once_with(service_ids)
+            assert services == mock_services
+
+    def test_get_services_by_ids_malformed(self, service_repository):
+        """Ensures that the get_services_by_ids method drops malformed IDs before looking up the others."""
+        service_id = uuid.uuid4()
+        with patch.object(Service.objects, 'in_bulk', return_value={}) as mock_in_bulk:
+            service_repository.get_services_by_ids([service_id, 'some-unique-id'])
+            mock_in_bulk.assert_called_once_with([service_id])
+
     def test_get_all_services(self, mock_service, service_repository):
         """Ensures that the get_all_services method retrieves all services correctly."""
         mock_services = [mock_service, mock_service]
@@ -72,6 +124,22 @@ class TestServiceRepository:
             mock_all.assert_called_once()
             assert services == mock_services
 
+    def test_iter_all_services(self, mock_service, service_repository):
+        """Ensures that the iter_all_services method streams all services in chunks."""
+        mock_services = iter([mock_service, mock_service])
+        with patch.object(Service.objects, 'iterator', return_value=mock_services) as mock_iterator:
+            services = service_repository.iter_all_services()
+            mock_iterator.assert_called_once_with(chunk_size=2000)
+            assert services is mock_services
+
+    def test_list_services_summary(self, mock_service, service_repository):
+        """Ensures that the list_services_summary method only loads the summary fields of each service."""
+        mock_services = [mock_service, mock_service]
+        with patch.object(Service.objects, 'only', return_value=mock_services) as mock_only:
+            services = service_repository.list_services_summary()
+            mock_only.assert_called_once_with('id', 'name', 'price', 'duration', 'availability')
+            assert services == mock_services
+
     def test_create_service(self, mock_service, service_repository):
         """Ensures that the create_service method handles service creation correctly."""
         service_data = {
@@ -100,34 +168,32 @@ class TestServiceRepository:
 
     def test_update_service(self, mock_service, service_repository):
         """Ensures that the update_service method updates a service's details correctly."""
-        service_id = 'some-unique-id'
+        service_id = uuid.uuid4()
         service_data = {
             'description': 'new description'
         }
         assert mock_service.description != service_data["description"]
         with patch.object(Service.objects, 'get', return_value=mock_service):
             updated_service = service_repository.update_service(service_id, service_data)
-            for key, value in service_data.items():
-                setattr(mock_service, key, value)
             mock_service.save.assert_called_once()
             assert updated_service == mock_service
             assert updated_service.description == service_data["description"]
 
 
     def test_update_service_with_invalid_data(self, service_repository):
-        """Ensures that update_service handles IntegrityError correctly."""
-        service_id = 'some-unique-id'
+        """Ensures that update_service lets an IntegrityError propagate, rather than reporting a missing service."""
+        service_id = uuid.uuid4()
         invalid_service_data = {
             'price': 'invalid-price',  # Assume this is an invalid price format
         }
         with patch.object(Service.objects, 'get', side_effect=IntegrityError):
-            service = service_repository.update_service(service_id, invalid_service_data)
-            assert not service
+            with pytest.raises(IntegrityError):
+                service_repository.update_service(service_id, invalid_service_data)
 
 
     def test_update_service_not_found(self, service_repository):
         """Ensures that the update_service method handles the case where a service to be updated is not found."""
-        service_id = 'non-existent-id'
+        service_id = uuid.uuid4()
         service_data = {
             'email': 'newemail@example.com'
         }
@@ -135,17 +201,40 @@ class TestServiceRepository:
             updated_service = service_repository.update_service(service_id, service_data)
             assert updated_service is None
 
-    def test_delete_service(self, mock_service, service_repository):
-        """Ensures that the delete_service method deletes a service by ID correctly."""
-        service_id = 'some-unique-id'
-        with patch.object(Service.objects, 'get', return_value=mock_service):
+    def test_fast_update_service(self, service_repository):
+        """Ensures that the fast_update_service method updates a service with a single UPDATE, returning the row count."""
+        service_id = uuid.uuid4()
+        service_data = {'price': 35}
+        with patch.object(Service.objects, 'filter') as mock_filter:
+            mock_filter.return_value.update.return_value = 1
+            updated_count = service_repository.fast_update_service(service_id, service_data)
+            mock_filter.assert_called_once_with(id=service_id)
+            mock_filter.return_value.update.assert_called_once_with(**service_data)
+            assert updated_count == 1
+
+    def test_fast_update_service_with_invalid_data(self, service_repository):
+        """Ensures that fast_update_service lets an IntegrityError propagate, rather than reporting no row updated."""
+        service_id = uuid.uuid4()
+        service_data = {'name': 'A name already taken'}
+        with patch.object(Service.objects, 'filter') as mock_filter:
+            mock_filter.return_value.update.side_effect = IntegrityError
+            with pytest.raises(IntegrityError):
+                service_repository.fast_update_service(service_id, service_data)
+
+    def test_delete_service(self, service_repository):
+        """Ensures that the delete_service method deletes a service by ID with a single filtered delete."""
+        service_id = uuid.uuid4()
+        with patch.object(Service.objects, 'filter') as mock_filter:
+            mock_filter.return_value.delete.return_value = (1, {'services.Service': 1})
             result = service_repository.delete_service(service_id)
-            mock_service.delete.assert_called_once()
+            mock_filter.assert_called_once_with(id=service_id)
+            mock_filter.return_value.delete.assert_called_once()
             assert result is True
 
     def test_delete_service_not_found(self, service_repository):
         """Ensures that the delete_service method handles the case where a service to be deleted is not found."""
-        service_id = 'non-existent-id'
-        with patch.object(Service.objects, 'get', side_effect=Service.DoesNotExist):
+        service_id = uuid.uuid4()
+        with patch.object(Service.objects, 'filter') as mock_filter:
+            mock_filter.return_value.delete.return_value = (0, {})
             result = service_repository.delete_service(service_id)
             assert result is False
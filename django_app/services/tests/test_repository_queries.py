@@ -0,0 +1,139 @@
+import pytest
+
+from datetime import datetime, timedelta
+from django.utils.timezone import make_aware as make_aware_of_timezone
+
+from appointments.models import Appointment
+from services.models import Service
+from services.repositories.service_repository import ServiceRepository
+from users.models import CustomUser
+
+
+@pytest.mark.django_db
+class TestServiceRepositoryQueries:
+    """
+    Test suite for the number of queries issued by the ServiceRepository class.
+
+    Unlike TestServiceRepository, these tests run against the database so that the queries Django actually
+    issues can be counted.
+    """
+    created_at = make_aware_of_timezone(datetime.now())
+    updated_at = make_aware_of_timezone(datetime.now())
+
+    def services_data(self, names):
+        """Returns the data for one service per name."""
+        return [
+            {
+                'created_at': self.created_at,
+                'updated_at': self.updated_at,
+                'name': name,
+                'description': 'Test Service Description',
+                'duration': 60,
+                'price': 50,
+            }
+            for name in names
+        ]
+
+    def test_bulk_create_services_single_insert_per_batch(self, django_assert_num_queries):
+        """Ensures that bulk_create_services inserts each batch of services with a single INSERT."""
+        services_data = self.services_data([f'Test Service Name {i}' for i in range(5)])
+        service_repository = ServiceRepository()
+
+        # Two INSERTs of at most three services, wrapped in a savepoint as the test already runs inside a transaction.
+        with django_assert_num_queries(4):
+            services = service_repository.bulk_create_services(services_data, batch_size=3)
+
+        assert len(services) == 5
+        assert Service.objects.count() == 5
+
+    def test_bulk_create_services_invalid_data(self):
+        """Ensures that bulk_create_services handles IntegrityError and persists none of the services."""
+        # A duplicate name should trigger an IntegrityError due to the unique constraint
+        services_data = self.services_data(['Test Service Name', 'Another Service Name', 'Test Service Name'])
+        service_repository = ServiceRepository()
+
+        assert service_repository.bulk_create_services(services_data) is None
+        assert Service.objects.count() == 0
+
+    def test_get_services_by_ids_skips_malformed(self, django_assert_num_queries):
+        """Ensures that a malformed ID among those looked up is skipped, rather than failing the whole lookup."""
+        [service] = ServiceRepository().bulk_create_services(self.services_data(['Test Service Name']))
+
+        with django_assert_num_queries(1):
+            services = ServiceRepository().get_services_by_ids([service.id, 'bad'])
+
+        assert list(services) == [service.id]
+
+    def test_update_service_sets_plain_fields_and_image(self):
+        """Ensures that update_service sets plain fields directly while the image still goes through its file descriptor."""
+        [service] = ServiceRepository().bulk_create_services(self.services_data(['Test Service Name']))
+        service_repository = ServiceRepository()
+
+        updated_service = service_repository.update_service(
+            service.id, {'description': 'Updated Description', 'image': 'service_images/haircut.png'}
+        )
+
+        assert updated_service.description == 'Updated Description'
+        assert updated_service.image.name == 'service_images/haircut.png'
+        service.refresh_from_db()
+        assert service.description == 'Updated Description'
+        assert service.image.name == 'service_images/haircut.png'
+
+    def create_services_with_appointments(self, count):
+        """Creates `count` services, each with two appointments for a single user."""
+        user = CustomUser.objects.create(
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+            username='test_username',
+            email='test_email',
+            password='test_password'
+        )
+        services = ServiceRepository().bulk_create_services(self.services_data([f'Test Service Name {i}' for i in range(count)]))
+        starts_at = self.created_at + timedelta(days=1)
+        Appointment.objects.bulk_create([
+            Appointment(
+                created_at=self.created_at,
+                updated_at=self.updated_at,
+                starts_at=starts_at + timedelta(hours=hours),
+                ends_at=starts_at + timedelta(hours=hours + 1),
+                status='scheduled',
+                user=user,
+                service=service,
+            )
+            for service in services
+            for hours in range(2)
+        ])
+
+    def test_get_all_services_prefetches_appointments(self, django_assert_num_queries):
+        """Ensures that walking the appointments of every service costs one extra query rather than one per service."""
+        self.create_services_with_appointments(3)
+        service_repository = ServiceRepository()
+
+        with django_assert_num_queries(2):
+            appointment_counts = [
+                len(service.appointments.all())
+                for service in service_repository.get_all_services(prefetch_related=['appointments'])
+            ]
+
+        assert appointment_counts == [2, 2, 2]
+
+    def test_get_service_by_id_prefetches_appointments(self, django_assert_num_queries):
+        """Ensures that a service can be retrieved together with its appointments."""
+        self.create_services_with_appointments(1)
+        service_id = Service.objects.get().id
+        service_repository = ServiceRepository()
+
+        with django_assert_num_queries(2):
+            service = service_repository.get_service_by_id(service_id, prefetch_related=['appointments'])
+            assert len(service.appointments.all()) == 2
+
+    def test_delete_service_single_delete(self, django_assert_num_queries):
+        """Ensures that delete_service deletes the service without first retrieving it through a separate lookup."""
+        [service] = ServiceRepository().bulk_create_services(self.services_data(['Test Service Name']))
+        service_repository = ServiceRepository()
+
+        # The service and the appointments protecting it are selected by Django's deletion collector, followed by the DELETE.
+        with django_assert_num_queries(3):
+            assert service_repository.delete_service(service.id) is True
+
+        assert not Service.objects.exists()
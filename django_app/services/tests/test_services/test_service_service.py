@@ -1,10 +1,12 @@
 import pytest
 
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError
+from django.utils.timezone import is_aware
 from unittest.mock import patch, MagicMock
 
-from services.services.service_service import ServiceService
-from services.repositories.service_repository import ServiceRepository
+from services.services.service_service import ServiceService, service_service as shared_service_service
+from services.repositories.service_repository import ServiceRepository, service_repository
 from services.services.validators.service_service_validator import ServiceServiceValidator
 
 class TestServiceService:
@@ -25,6 +27,21 @@ class TestServiceService:
         service.validator = MagicMock(spec=ServiceServiceValidator)
         return service
 
+    def test_shared_repository(self):
+        """
+        Ensures that every ServiceService reuses the module level ServiceRepository.
+        """
+        service = ServiceService()
+
+        assert service.service_repository is service_repository
+
+    def test_shared_service(self):
+        """
+        Ensures that a module level ServiceService, with its validator, is available for reuse across requests.
+        """
+        assert isinstance(shared_service_service, ServiceService)
+        assert isinstance(shared_service_service.validator, ServiceServiceValidator)
+
     def test_create_service_calls_validator(self, service_service):
         """
         Ensures that the create_service method calls the validator.
@@ -38,6 +55,32 @@ class TestServiceService:
         service_service.validator.validate_service_data.assert_called_once_with(service_data)
         service_service.service_repository.create_service.assert_called_once_with(service_data)
 
+    def test_create_service_sets_timestamps(self, service_service):
+        """
+        Ensures that the create_service method stamps created_at and updated_at with the same aware datetime.
+        """
+        service_data = {'name': 'Haircut', 'description': 'A standard haircut', 'price': 25}
+
+        service_service.create_service(service_data)
+
+        assert service_data['created_at'] == service_data['updated_at']
+        assert is_aware(service_data['created_at'])
+
+    def test_create_services(self, service_service):
+        """
+        Ensures that the create_services method stamps and validates every service before creating them in bulk.
+        """
+        services_data = [
+            {'name': 'Haircut', 'description': 'A standard haircut', 'price': 25},
+            {'name': 'Shave', 'description': 'A hot towel shave', 'price': 15},
+        ]
+
+        service_service.create_services(services_data)
+
+        assert services_data[0]['created_at'] == services_data[1]['updated_at']
+        service_service.validator.validate_many.assert_called_once_with(services_data)
+        service_service.service_repository.bulk_create_services.assert_called_once_with(services_data)
+
     def test_create_service_validation_error(self, service_service):
         """
         Ensures that the create_service method raises a ValidationError when validation fails.
@@ -61,19 +104,111 @@ class TestServiceService:
         service_service.service_repository.get_service_by_id.assert_called_once_with(service_id)
         assert service['id'] == service_id
 
+    def test_get_services(self, service_service):
+        """
+        Ensures that the get_services method retrieves several services with one repository call.
+        """
+        service_ids = ['some-unique-id', 'another-unique-id']
+        services_by_id = {service_id: {'id': service_id} for service_id in service_ids}
+        service_service.service_repository.get_services_by_ids.return_value = services_by_id
+
+        services = service_service.get_services(service_ids)
+
+        service_service.service_repository.get_services_by_ids.assert_called_once_with(service_ids)
+        service_service.service_repository.get_service_by_id.assert_not_called()
+        assert services == services_by_id
+
+    @pytest.mark.parametrize(
+            'summary,repository_method',
+            [
+                (False, 'get_all_services'),
+                (True, 'list_services_summary'),
+            ]
+    )
+    def test_get_all_services(self, service_service, summary, repository_method):
+        """
+        Ensures that the get_all_services method only loads the summary projection when asked for it.
+        """
+        services = service_service.get_all_services(summary=summary)
+
+        getattr(service_service.service_repository, repository_method).assert_called_once_with()
+        assert services == getattr(service_service.service_repository, repository_method).return_value
+
     def test_update_service_calls_validator(self, service_service):
         """
-        Ensures that the update_service method calls the validator.
+        Ensures that the update_service method calls the validator and updates the service with a single UPDATE.
         """
         service_id = 'some-unique-id'
         service_data = {'name': 'Updated Haircut', 'description': 'An updated haircut', 'price': 30}
         service_service.validator.validate_service_data.return_value = None
+        service_service.service_repository.fast_update_service.return_value = 1
+        service_service.service_repository.get_service_by_id.return_value = service_data
+
+        service = service_service.update_service(service_id, service_data)
+
+        service_service.validator.validate_service_data.assert_called_once_with(service_data, is_update=True)
+        service_service.service_repository.fast_update_service.assert_called_once_with(service_id, service_data)
+        service_service.service_repository.get_service_by_id.assert_called_once_with(service_id)
+        service_service.service_repository.update_service.assert_not_called()
+        assert service == service_data
+
+    def test_update_service_not_found(self, service_service):
+        """
+        Ensures that the update_service method raises a ValidationError when no service was updated, without re-reading it.
+        """
+        service_id = 'non-existent-id'
+        service_data = {'name': 'Updated Haircut'}
+        service_service.service_repository.fast_update_service.return_value = 0
+        service_service.validator.validate_service_exists.side_effect = ValidationError("Service does not exist")
+
+        with pytest.raises(ValidationError, match="Service does not exist"):
+            service_service.update_service(service_id, service_data)
+
+        service_service.service_repository.get_service_by_id.assert_not_called()
+        service_service.validator.validate_service_exists.assert_called_once_with(None, service_id)
+
+    def test_update_service_not_found_with_invalid_data(self, service_service):
+        """
+        Ensures that the update_service method reports a missing service, rather than the errors in the data it was given.
+        """
+        service_id = 'non-existent-id'
+        service_data = {'name': ''}
+        service_service.validator.validate_service_data.side_effect = ValidationError("Service name is required")
+        service_service.service_repository.get_service_by_id.return_value = None
+        service_service.validator.validate_service_exists.side_effect = ValidationError("Service does not exist")
+
+        with pytest.raises(ValidationError, match="Service does not exist"):
+            service_service.update_service(service_id, service_data)
+
+        service_service.validator.validate_service_exists.assert_called_once_with(None, service_id)
+        service_service.service_repository.fast_update_service.assert_not_called()
+
+    def test_update_service_integrity_error(self, service_service):
+        """
+        Ensures that the update_service method reports an IntegrityError from the UPDATE as a ValidationError.
+        """
+        service_id = 'some-unique-id'
+        service_data = {'name': 'A name already taken'}
+        service_service.service_repository.fast_update_service.side_effect = IntegrityError("duplicate key value")
+
+        with pytest.raises(ValidationError, match="Error updating service: duplicate key value"):
+            service_service.update_service(service_id, service_data)
+
+    def test_update_service_with_image(self, service_service):
+        """
+        Ensures that the update_service method saves the service when an image is given, so the image file is stored.
+        """
+        service_id = 'some-unique-id'
+        service_data = {'image': 'service_images/haircut.png'}
         service_service.service_repository.update_service.return_value = service_data
 
         service_service.update_service(service_id, service_data)
 
         service_service.validator.validate_service_data.assert_called_once_with(service_data, is_update=True)
         service_service.service_repository.update_service.assert_called_once_with(service_id, service_data)
+        service_service.service_repository.fast_update_service.assert_not_called()
+        service_service.service_repository.get_service_by_id.assert_not_called()
+        service_service.validator.validate_service_exists.assert_called_once_with(service_data, service_id)
 
     def test_update_service_validation_error(self, service_service):
         """
@@ -95,6 +230,8 @@ class TestServiceService:
 
         result = service_service.delete_service(service_id)
 
+        service_service.service_repository.get_service_by_id.assert_not_called()
+        service_service.validator.validate_service_exists.assert_not_called()
         service_service.service_repository.delete_service.assert_called_once_with(service_id)
         assert result is True
 
@@ -108,4 +245,5 @@ class TestServiceService:
         result = service_service.delete_service(service_id)
 
         service_service.service_repository.delete_service.assert_called_once_with(service_id)
+        service_service.validator.validate_service_exists.assert_called_once_with(None, service_id)
         assert result is False
\ No newline at end of file
@@ -1,6 +1,7 @@
 import pytest
 
 from datetime import datetime
+from decimal import Decimal
 from django.core.exceptions import ValidationError
 
 from services.services.validators.service_service_validator import ServiceServiceValidator
@@ -53,6 +54,51 @@ class TestServiceServiceValidator:
             service_data = {'id': 'some-id'}
             validator.validate_service_data(service_data, is_update=True)
     
+    def test_validate_many(self, validator):
+        """
+        Ensures that validating several service data reports every error, keyed by the index of the service data.
+        """
+        now = datetime.now().astimezone()
+        service_data = {
+            'created_at': now,
+            'updated_at': now,
+            'name': 'Haircut',
+            'description': 'A standard haircut',
+            'duration': 30,
+            'price': 25,
+        }
+        services_data = [service_data, {**service_data, 'name': 'Ha', 'price': 0}, service_data]
+
+        with pytest.raises(ValidationError) as exc_info:
+            validator.validate_many(services_data)
+
+        assert exc_info.value.message_dict == {
+            1: ["Service name must be at least 3 characters long.", "Service price must be a positive number."],
+        }
+        validator.validate_many([service_data, service_data])
+
+    @pytest.mark.parametrize('is_update', [False, True])
+    def test_validate_service_data_missing_fields(self, validator, is_update):
+        """
+        Ensures that missing fields are reported together, before any field is validated.
+        """
+        service_data = {'name': 'Ha', 'duration': 30}
+
+        with pytest.raises(ValidationError, match="Missing fields: description, price."):
+            validator.validate_service_data(service_data, is_update=is_update)
+
+    @pytest.mark.parametrize('is_update', [False, True])
+    def test_validate_service_data_without_timestamps(self, validator, is_update):
+        """
+        Ensures that timestamps are only validated when present, as ServiceService stamps them itself.
+        """
+        service_data = {'name': 'Haircut', 'description': 'A standard haircut', 'duration': 30, 'price': 25}
+
+        validator.validate_service_data(service_data, is_update=is_update)
+
+        with pytest.raises(ValidationError, match="updated_at must be an aware datetime object with timezone information."):
+            validator.validate_service_data({**service_data, 'updated_at': datetime.now()}, is_update=is_update)
+
     def test_validate_updated_at_required(self, validator):
         """
         Ensures that a missing updated_at timestamp raises a ValidationError.
@@ -135,6 +181,20 @@ class TestServiceServiceValidator:
         with pytest.raises(ValidationError, match=f"Service duration must be at least {min_allowed_duration} minutes."):
             validator.validate_duration(min_allowed_duration - 1)
 
+    @pytest.mark.parametrize('duration', [10, 480])
+    def test_validate_duration_bounds_allowed(self, validator, duration):
+        """
+        Ensures that a service duration equal to either bound is allowed.
+        """
+        validator.validate_duration(duration)
+
+    def test_validate_duration_zero(self, validator):
+        """
+        Ensures that a zero service duration is reported as too short rather than as missing.
+        """
+        with pytest.raises(ValidationError, match="Service duration must be at least 10 minutes."):
+            validator.validate_duration(0)
+
     def test_validate_duration_too_long(self, validator):
         """
         Ensures that a service duration longer than the allowed amount raises a ValidationError.
@@ -157,6 +217,9 @@ class TestServiceServiceValidator:
         with pytest.raises(ValidationError, match="Service price must be a positive number."):
             validator.validate_price(-50)
 
+        with pytest.raises(ValidationError, match="Service price must be a positive number."):
+            validator.validate_price(0)
+
     def test_validate_price_format(self, validator):
         """
         Ensures that a service price with invalid format raises a ValidationError.
@@ -170,10 +233,21 @@ class TestServiceServiceValidator:
         with pytest.raises(ValidationError, match="Service price must have a maximum of 5 digits with up to 2 decimal places."):
             validator.validate_price(1234.567)
 
+        with pytest.raises(ValidationError, match="Service price must have a maximum of 5 digits with up to 2 decimal places."):
+            validator.validate_price(Decimal('12.345'))
+
+        # Booleans, non-finite values and non-numeric strings are not prices
+        for price in (
+            True, False, float('nan'), float('inf'), Decimal('NaN'), Decimal('sNaN'), Decimal('Infinity'), 'abc', [25]
+        ):
+            with pytest.raises(ValidationError, match="Service price must have a maximum of 5 digits with up to 2 decimal places."):
+                validator.validate_price(price)
+
         # Valid formats
         try:
             validator.validate_price(123.45)
             validator.validate_price(12.34)
             validator.validate_price(123)
+            validator.validate_price(Decimal('50.00'))
         except ValidationError:
             pytest.fail("Unexpected ValidationError for valid price format.")
@@ -1,7 +1,5 @@
-from datetime import datetime
-
 from django.core.exceptions import ValidationError
-from django.utils.timezone import make_aware as make_aware_of_timezone
+from django.utils import timezone
 
 from users.services.validators.user_service_validator import UserServiceValidator
 from users.repositories.user_repository import UserRepository
@@ -34,8 +32,9 @@ class UserService(UserServiceInterface):
         return users
 
     def create_user(self, user_data):
-        user_data['created_at'] = make_aware_of_timezone(datetime.now())
-        user_data['updated_at'] = make_aware_of_timezone(datetime.now())
+        now = timezone.now()
+        user_data['created_at'] = now
+        user_data['updated_at'] = now
         self.validator.validate_user_data(user_data)
         try:
             self.user_repository.create_user(user_data)
@@ -46,7 +45,7 @@ class UserService(UserServiceInterface):
         user = self.user_repository.get_user_by_id(user_id)
         self.validator.validate_user_exists(user, user_id)
         # Set updated_at timestamp and validate data before updating.
-        user_data['updated_at'] = make_aware_of_timezone(datetime.now())
+        user_data['updated_at'] = timezone.now()
         self.validator.validate_user_data(user_data, is_update=True)
         try:
             return self.user_repository.update_user(user_id, user_data, partial=partial)
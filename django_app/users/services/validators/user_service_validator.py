@@ -61,7 +61,7 @@ class UserServiceValidator:
             raise ValidationError("created_at is required.")
         if not isinstance(created_at, datetime):
             raise ValidationError("created_at must be a datetime object.")
-        if created_at.tzinfo is None or created_at.tzinfo.utcoffset(created_at) is None:
+        if created_at.utcoffset() is None:
             raise ValidationError("created_at must be an aware datetime object with timezone information.")
 
     def validate_updated_at(self, updated_at):
@@ -76,7 +76,7 @@ class UserServiceValidator:
             raise ValidationError("updated_at is required.")
         if not isinstance(updated_at, datetime):
             raise ValidationError("updated_at must be a datetime object.")
-        if updated_at.tzinfo is None or updated_at.tzinfo.utcoffset(updated_at) is None:
+        if updated_at.utcoffset() is None:
             raise ValidationError("updated_at must be an aware datetime object with timezone information.")
         
     def validate_username(self, username, is_update=False):
@@ -123,7 +123,7 @@ class UserServiceValidator:
             return
         if not first_name.isalpha():
             raise ValidationError("First name must contain only alphabetic characters.")
-        if len(first_name) < 1 or len(first_name) > 30:
+        if not 1 <= len(first_name) <= 30:
             raise ValidationError("First name must be between 1 and 30 characters long.")
 
     def validate_last_name(self, last_name):
@@ -132,7 +132,7 @@ class UserServiceValidator:
             return
         if not last_name.isalpha():
             raise ValidationError("Last name must contain only alphabetic characters.")
-        if len(last_name) < 1 or len(last_name) > 30:
+        if not 1 <= len(last_name) <= 30:
             raise ValidationError("Last name must be between 1 and 30 characters long.")
 
     def validate_profile_picture(self, profile_picture):
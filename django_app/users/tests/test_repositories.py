@@ -108,8 +108,6 @@ class TestUserRepository:
         assert mock_user.email != user_data["email"]
         with patch.object(CustomUser.objects, 'get', return_value=mock_user):
             updated_user = user_repository.update_user(user_id, user_data)
-            for key, value in user_data.items():
-                setattr(mock_user, key, value)
             mock_user.save.assert_called_once()
             assert updated_user == mock_user
             assert mock_user.email == user_data["email"]
@@ -1,6 +1,7 @@
 import pytest
 
 from django.core.exceptions import ValidationError
+from django.utils.timezone import is_aware
 from django.core.files.uploadedfile import SimpleUploadedFile
 from unittest.mock import MagicMock, patch
 
@@ -23,6 +24,7 @@ class TestUserService:
     Tests:
         - test_get_user
         - test_create_user_calls_validator
+        - test_create_user_sets_timestamps
         - test_create_user_validation_error
         - test_update_user_calls_validator
         - test_update_user_validation_error
@@ -70,6 +72,17 @@ class TestUserService:
             user_service.create_user(user_data)
             user_service.validator.validate_user_data.assert_called_once_with(user_data)
 
+    def test_create_user_sets_timestamps(self, user_service):
+        """
+        Ensures that the create_user method stamps created_at and updated_at with the same aware datetime.
+        """
+        user_data = {'username': 'testuser', 'email': 'testuser@example.com', 'password': 'Testpassword@123'}
+
+        user_service.create_user(user_data)
+
+        assert user_data['created_at'] == user_data['updated_at']
+        assert is_aware(user_data['created_at'])
+
     def test_create_user_validation_error(self, user_service):
         """
         Ensures that the create_user method raises a ValidationError when validation fails.